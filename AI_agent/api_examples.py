@@ -34,7 +34,7 @@ See examples below:
 """
 
 import asyncio
-from loanai_agent.main import LoanApplicationProcessor
+from loanai_agent.main import get_processor
 from loanai_agent.models import (
     DocumentInfo,
     DocumentType,
@@ -59,7 +59,7 @@ async def example_basic_processing():
     """Basic example of processing a loan application."""
     
     # Initialize the processor
-    processor = LoanApplicationProcessor()
+    processor = get_processor()
     
     # Create application data
     personal_info = PersonalInfo(
@@ -138,7 +138,7 @@ async def example_basic_processing():
 async def example_detailed_analysis():
     """Example showing how to access detailed analysis."""
     
-    processor = LoanApplicationProcessor()
+    processor = get_processor()
     
     # ... (create application as in example 1)
     
@@ -166,7 +166,7 @@ async def example_detailed_analysis():
 async def example_batch_processing():
     """Example of processing multiple applications."""
     
-    processor = LoanApplicationProcessor()
+    processor = get_processor()
     decisions = []
     
     # Create multiple applications
@@ -200,7 +200,7 @@ async def example_error_handling():
         ValidationException,
     )
     
-    processor = LoanApplicationProcessor()
+    processor = get_processor()
     
     try:
         # Create application (may raise validation error)
@@ -243,9 +243,8 @@ def example_custom_configuration():
     print(f"Debug Mode: {settings.debug}")
     print(f"Log Level: {settings.log_level}")
     
-    # Modify settings (at runtime)
-    # settings.debug = False
-    # settings.log_level = "INFO"
+    # Settings are read-only at runtime; change them through environment
+    # variables or .env (e.g. DEBUG=false, LOG_LEVEL=INFO) and restart
 
 
 # ============================================================================
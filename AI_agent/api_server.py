@@ -4,38 +4,106 @@ This server exposes the loan processing functionality through REST API endpoints
 """
 
 import asyncio
+import os
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException, status
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from config.settings import settings
 from loanai_agent.main import LoanApplicationProcessor
 from loanai_agent.models import (
-    DocumentInfo,
     DocumentType,
-    Education,
     EducationLevel,
-    Employment,
     EmploymentStatus,
     Gender,
     LoanApplication,
     LoanPurpose,
-    LoanRequest,
-    PersonalInfo,
 )
-from loanai_agent.utils import get_logger
+from loanai_agent.utils import TTLCache, get_logger
+
+# asyncpg is optional: without it decisions are only tracked in memory
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+    asyncpg = None
 
 logger = get_logger(__name__)
 
 # Global processor instance
 processor: Optional[LoanApplicationProcessor] = None
 
-# In-memory status tracking (replace with database in production)
-application_status: Dict[str, Dict[str, Any]] = {}
+# In-memory status tracking (replace with database in production).
+# Bounded by size and age so completed applications don't accumulate forever.
+application_status: TTLCache = TTLCache(
+    maxsize=int(os.getenv("STATUS_CACHE_MAX", "10000")),
+    ttl=int(os.getenv("STATUS_CACHE_TTL", "86400")),
+)
+
+# Recently converted requests, keyed by customer ID, so client retries of an
+# identical payload reuse the previous LoanApplication
+_conversion_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+
+# Application progress flags, packed into one int per status entry
+PROGRESS_RECEIVED = 1
+PROGRESS_VALIDATING = 2
+PROGRESS_PROCESSING = 4
+PROGRESS_COMPLETED = 8
+_PROGRESS_FLAGS = (
+    ("received", PROGRESS_RECEIVED),
+    ("validating", PROGRESS_VALIDATING),
+    ("processing", PROGRESS_PROCESSING),
+    ("completed", PROGRESS_COMPLETED),
+)
+
+# Maximum page size for /api/applications
+MAX_APPLICATIONS_PAGE = 500
+
+# Background processing: fixed worker pool fed by a bounded queue
+LOAN_WORKERS = int(os.getenv("LOAN_WORKERS", "4"))
+LOAN_QUEUE_MAX = int(os.getenv("LOAN_QUEUE_MAX", "1000"))
+LOAN_SHUTDOWN_TIMEOUT = float(os.getenv("LOAN_SHUTDOWN_TIMEOUT", "30"))
+
+# Enum value -> member lookups, used for request validation and conversion
+_GENDER_MAP = {g.value: g for g in Gender}
+_EDUCATION_LEVEL_MAP = {e.value: e for e in EducationLevel}
+_EMPLOYMENT_STATUS_MAP = {e.value: e for e in EmploymentStatus}
+_LOAN_PURPOSE_MAP = {p.value: p for p in LoanPurpose}
+
+# Database connection parameters (read once at import)
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_PORT = int(os.getenv("DB_PORT", "5432"))
+DB_USER = os.getenv("DB_USER", "loanai_user")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "loanai_password")
+DB_NAME = os.getenv("DB_NAME", "loanai")
+DB_POOL_MIN_SIZE = 2
+DB_POOL_MAX_SIZE = 10
+DB_COMMAND_TIMEOUT = 10
+DB_CONNECT_TIMEOUT = 5
+
+# AI decision -> customers.application_status
+_STATUS_MAP = {
+    "APPROVED": "approved",
+    "REJECTED": "rejected",
+    "MANUAL_REVIEW": "manual_review",
+}
+
+_UPDATE_DECISION_SQL = """
+    UPDATE customers
+    SET application_status = $1,
+        eligibility_score = $2,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE customer_id = $3
+"""
 
 
 @asynccontextmanager
@@ -51,9 +119,123 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize processor: {e}")
         raise
     
+    # Created lazily on first use so the API can start before the database
+    app.state.db_pool = None
+    app.state.db_pool_lock = asyncio.Lock()
+    if not ASYNCPG_AVAILABLE:
+        logger.warning("asyncpg not installed. Install with: pip install asyncpg")
+    
+    app.state.work_queue = asyncio.Queue(maxsize=LOAN_QUEUE_MAX)
+    app.state.workers = [
+        asyncio.create_task(_worker(app.state.work_queue))
+        for _ in range(LOAN_WORKERS)
+    ]
+    logger.info(f"Started {LOAN_WORKERS} loan processing workers")
+    
     yield
     
     logger.info("Shutting down LoanAI Agent API Server")
+    await _drain_work_queue(app.state.work_queue)
+    for worker in app.state.workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.workers, return_exceptions=True)
+    if app.state.db_pool is not None:
+        await app.state.db_pool.close()
+        logger.info("Database connection pool closed")
+
+
+async def _worker(queue: asyncio.Queue) -> None:
+    """Process queued loan applications one at a time.
+    
+    Args:
+        queue: Queue of LoanApplication objects to process
+    """
+    while True:
+        application = await queue.get()
+        try:
+            await _process_application_async(application)
+        finally:
+            queue.task_done()
+
+
+async def _drain_work_queue(queue: asyncio.Queue) -> None:
+    """Give queued applications a bounded time to finish before shutdown.
+    
+    Anything still queued after LOAN_SHUTDOWN_TIMEOUT is dropped and logged.
+    
+    Args:
+        queue: Work queue feeding the processing workers
+    """
+    try:
+        await asyncio.wait_for(queue.join(), timeout=LOAN_SHUTDOWN_TIMEOUT)
+        return
+    except asyncio.TimeoutError:
+        pass
+    
+    abandoned = []
+    while not queue.empty():
+        abandoned.append(queue.get_nowait().customer_id)
+        queue.task_done()
+    if abandoned:
+        logger.warning(
+            f"Abandoning {len(abandoned)} queued applications on shutdown: {abandoned}"
+        )
+
+
+async def _get_db_pool():
+    """Return the shared database connection pool, creating it if needed.
+    
+    Creation is retried on the next call if the database is unavailable.
+    
+    Returns:
+        asyncpg pool, or None if the database is unavailable
+    """
+    pool = getattr(app.state, "db_pool", None)
+    if pool is not None:
+        return pool
+    
+    lock = getattr(app.state, "db_pool_lock", None)
+    if lock is None:
+        return None
+    
+    async with lock:
+        if app.state.db_pool is None:
+            app.state.db_pool = await _create_db_pool()
+        return app.state.db_pool
+
+
+async def _create_db_pool():
+    """Create the shared database connection pool.
+    
+    Returns:
+        asyncpg pool, or None if the database is unavailable
+    """
+    try:
+        pool = await asyncpg.create_pool(
+            host=DB_HOST,
+            port=DB_PORT,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            database=DB_NAME,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            command_timeout=DB_COMMAND_TIMEOUT,
+            timeout=DB_CONNECT_TIMEOUT,
+        )
+        logger.info(f"Database connection pool created ({DB_HOST}:{DB_PORT}/{DB_NAME})")
+        return pool
+    except Exception as e:
+        # Non-critical: decisions are still tracked in memory
+        logger.error(f"Failed to create database connection pool: {e}")
+        return None
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize response content to JSON bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 # Initialize FastAPI app
@@ -61,6 +243,7 @@ app = FastAPI(
     title="LoanAI Agent API",
     description="AI Multi-Agent System for Intelligent Loan Processing",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -69,8 +252,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # Next.js frontend
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["Link", "X-Total-Count"],  # /api/applications pagination
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 
@@ -107,37 +292,37 @@ class ProcessLoanRequest(BaseModel):
     @classmethod
     def validate_gender(cls, v: str) -> str:
         """Validate gender field."""
-        valid_genders = [g.value for g in Gender]
-        if v.lower() not in valid_genders:
-            raise ValueError(f"Gender must be one of: {valid_genders}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _GENDER_MAP:
+            raise ValueError(f"Gender must be one of: {sorted(_GENDER_MAP)}")
+        return v_lower
 
     @field_validator('educationLevel')
     @classmethod
     def validate_education_level(cls, v: str) -> str:
         """Validate education level."""
-        valid_levels = [e.value for e in EducationLevel]
-        if v.lower() not in valid_levels:
-            raise ValueError(f"Education level must be one of: {valid_levels}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _EDUCATION_LEVEL_MAP:
+            raise ValueError(f"Education level must be one of: {sorted(_EDUCATION_LEVEL_MAP)}")
+        return v_lower
 
     @field_validator('employmentStatus')
     @classmethod
     def validate_employment_status(cls, v: str) -> str:
         """Validate employment status."""
-        valid_statuses = [e.value for e in EmploymentStatus]
-        if v.lower() not in valid_statuses:
-            raise ValueError(f"Employment status must be one of: {valid_statuses}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _EMPLOYMENT_STATUS_MAP:
+            raise ValueError(f"Employment status must be one of: {sorted(_EMPLOYMENT_STATUS_MAP)}")
+        return v_lower
 
     @field_validator('loanPurpose')
     @classmethod
     def validate_loan_purpose(cls, v: str) -> str:
         """Validate loan purpose."""
-        valid_purposes = [p.value for p in LoanPurpose]
-        if v.lower() not in valid_purposes:
-            raise ValueError(f"Loan purpose must be one of: {valid_purposes}")
-        return v.lower()
+        v_lower = v.lower()
+        if v_lower not in _LOAN_PURPOSE_MAP:
+            raise ValueError(f"Loan purpose must be one of: {sorted(_LOAN_PURPOSE_MAP)}")
+        return v_lower
 
 
 class ProcessLoanResponse(BaseModel):
@@ -165,25 +350,61 @@ async def health_check():
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=datetime.now(timezone.utc).isoformat(),
         version="1.0.0",
         processor_initialized=processor is not None,
     )
 
 
-@app.post("/api/process", response_model=ProcessLoanResponse, tags=["Loan Processing"])
-async def process_loan_application(request: ProcessLoanRequest):
+def _parse_process_request(body: bytes) -> ProcessLoanRequest:
+    """Parse and validate a raw /api/process body in a single pass.
+    
+    Args:
+        body: Raw JSON request body
+        
+    Returns:
+        Validated ProcessLoanRequest
+        
+    Raises:
+        RequestValidationError: If the body is not a valid request
+    """
+    try:
+        return ProcessLoanRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+
+
+@app.post(
+    "/api/process",
+    response_model=ProcessLoanResponse,
+    tags=["Loan Processing"],
+    # The body is parsed manually, so declare its schema for the docs
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ProcessLoanRequest.model_json_schema()}},
+        }
+    },
+)
+async def process_loan_application(raw_request: Request):
     """Process a loan application through the AI multi-agent system.
     
     This endpoint accepts a loan application and initiates processing through
     the multi-agent system. The processing happens asynchronously.
     
+    The JSON body is validated straight from bytes with model_validate_json,
+    skipping the intermediate dict FastAPI would otherwise build.
+    
     Args:
-        request: Loan application data
+        raw_request: Incoming request carrying ProcessLoanRequest JSON
         
     Returns:
         Response indicating processing has started
     """
+    request = _parse_process_request(await raw_request.body())
+    
     if processor is None:
         logger.error("Processor not initialized")
         raise HTTPException(
@@ -191,35 +412,39 @@ async def process_loan_application(request: ProcessLoanRequest):
             detail="Loan processing service is not available"
         )
     
+    # Reject before touching any existing status entry for this customer
+    if app.state.work_queue.full():
+        logger.warning(f"Processing queue full, rejecting customer: {request.customerId}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Loan processing queue is full, please retry later"
+        )
+    
     try:
         logger.info(f"Received loan application for customer: {request.customerId}")
         
         # Initialize status tracking
-        application_status[request.customerId] = {
+        entry = {
             "customerId": request.customerId,
             "status": "received",
             "message": "Application received and queued for processing",
-            "receivedAt": datetime.utcnow().isoformat(),
+            "receivedAt": datetime.now(timezone.utc).isoformat(),
             "estimatedCompletion": "5-10 minutes",
-            "progress": {
-                "received": True,
-                "validating": False,
-                "processing": False,
-                "completed": False
-            }
+            "progress": PROGRESS_RECEIVED,
         }
+        application_status[request.customerId] = entry
         
         # Convert request to LoanApplication model
-        application = _convert_to_loan_application(request)
+        application = _get_loan_application(request)
         
-        # Update status to processing
-        application_status[request.customerId]["status"] = "processing"
-        application_status[request.customerId]["message"] = "Application is being processed by AI agents"
-        application_status[request.customerId]["progress"]["validating"] = True
-        application_status[request.customerId]["progress"]["processing"] = True
+        # Hand off to the background worker pool (capacity checked above,
+        # with no await in between, so this cannot raise QueueFull)
+        app.state.work_queue.put_nowait(application)
         
-        # Start processing in background (fire-and-forget)
-        asyncio.create_task(_process_application_async(application))
+        # Update status to processing
+        entry["status"] = "processing"
+        entry["message"] = "Application is being processed by AI agents"
+        entry["progress"] |= PROGRESS_VALIDATING | PROGRESS_PROCESSING
         
         return ProcessLoanResponse(
             success=True,
@@ -250,14 +475,15 @@ async def _process_application_async(application: LoanApplication):
         application: Loan application to process
     """
     customer_id = application.customer_id
+    entry = application_status.get(customer_id)
     
     try:
         logger.info(f"Starting async processing for customer: {customer_id}")
         
         # Update status
-        if customer_id in application_status:
-            application_status[customer_id]["status"] = "analyzing"
-            application_status[customer_id]["message"] = "AI agents are analyzing your application"
+        if entry is not None:
+            entry["status"] = "analyzing"
+            entry["message"] = "AI agents are analyzing your application"
         
         result = await processor.process(application)
         
@@ -267,21 +493,23 @@ async def _process_application_async(application: LoanApplication):
         )
         
         # Update status with results
-        if customer_id in application_status:
-            application_status[customer_id]["status"] = "completed"
-            application_status[customer_id]["message"] = "Application processing completed"
-            application_status[customer_id]["progress"]["completed"] = True
-            application_status[customer_id]["completedAt"] = datetime.utcnow().isoformat()
-            application_status[customer_id]["result"] = {
-                "decision": result.decision,
-                "risk_score": result.risk_score,
-                "confidence_score": result.confidence_score,
-                "loan_amount": result.loan_amount,
-                "interest_rate": result.interest_rate,
-                "loan_duration": result.loan_duration,
-                "conditions": result.conditions,
-                "reasoning": result.reasoning
-            }
+        if entry is not None:
+            entry["progress"] |= PROGRESS_COMPLETED
+            entry.update({
+                "status": "completed",
+                "message": "Application processing completed",
+                "completedAt": datetime.now(timezone.utc).isoformat(),
+                "result": {
+                    "decision": result.decision,
+                    "risk_score": result.risk_score,
+                    "confidence_score": result.confidence_score,
+                    "loan_amount": result.loan_amount,
+                    "interest_rate": result.interest_rate,
+                    "loan_duration": result.loan_duration,
+                    "conditions": result.conditions,
+                    "reasoning": result.reasoning
+                },
+            })
         
         # Update database with decision
         await _update_database_with_decision(customer_id, result)
@@ -293,11 +521,13 @@ async def _process_application_async(application: LoanApplication):
         )
         
         # Update status with error
-        if customer_id in application_status:
-            application_status[customer_id]["status"] = "failed"
-            application_status[customer_id]["message"] = "Processing failed due to an error"
-            application_status[customer_id]["error"] = str(e)
-            application_status[customer_id]["failedAt"] = datetime.utcnow().isoformat()
+        if entry is not None:
+            entry.update({
+                "status": "failed",
+                "message": "Processing failed due to an error",
+                "error": str(e),
+                "failedAt": datetime.now(timezone.utc).isoformat(),
+            })
 
 
 async def _update_database_with_decision(customer_id: str, result) -> None:
@@ -307,145 +537,154 @@ async def _update_database_with_decision(customer_id: str, result) -> None:
         customer_id: Customer UUID
         result: DecisionResult object from the AI processor
     """
-    try:
-        import os
-        import asyncpg
-        
-        # Get database connection parameters from environment
-        db_host = os.getenv('DB_HOST', '127.0.0.1')
-        db_port = int(os.getenv('DB_PORT', '5432'))
-        db_user = os.getenv('DB_USER', 'loanai_user')
-        db_password = os.getenv('DB_PASSWORD', 'loanai_password')
-        db_name = os.getenv('DB_NAME', 'loanai')
-        
-        # Connect to database
-        conn = await asyncpg.connect(
-            host=db_host,
-            port=db_port,
-            user=db_user,
-            password=db_password,
-            database=db_name
+    if not ASYNCPG_AVAILABLE:
+        logger.warning(
+            f"asyncpg not installed, skipping database update for customer {customer_id}"
+        )
+        return
+    
+    pool = await _get_db_pool()
+    if pool is None:
+        logger.warning(
+            f"Database pool not available, skipping update for customer {customer_id}"
         )
+        return
+    
+    try:
+        application_status_value = _STATUS_MAP.get(result.decision, "manual_review")
+        eligibility_score = _eligibility_score(result.confidence_score, result.risk_score)
         
-        try:
-            # Map decision to application status
-            status_mapping = {
-                "APPROVED": "approved",
-                "REJECTED": "rejected",
-                "MANUAL_REVIEW": "manual_review"
-            }
-            application_status_value = status_mapping.get(result.decision, "manual_review")
-            
-            # Calculate eligibility score (0-100) from confidence and risk
-            # Higher confidence and lower risk = higher eligibility
-            eligibility_score = int((result.confidence_score * 100) * (1 - result.risk_score / 100))
-            
-            # Update customers table
+        # asyncpg caches the prepared statement per pooled connection
+        async with pool.acquire() as conn:
             await conn.execute(
-                """
-                UPDATE customers 
-                SET application_status = $1, 
-                    eligibility_score = $2,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE customer_id = $3
-                """,
+                _UPDATE_DECISION_SQL,
                 application_status_value,
                 eligibility_score,
                 customer_id
             )
+        
+        logger.info(
+            f"Database updated for customer {customer_id}: "
+            f"status={application_status_value}, score={eligibility_score}"
+        )
             
-            logger.info(
-                f"Database updated for customer {customer_id}: "
-                f"status={application_status_value}, score={eligibility_score}"
-            )
-            
-        finally:
-            await conn.close()
-            
-    except ImportError:
-        logger.warning("asyncpg not installed. Install with: pip install asyncpg")
     except Exception as e:
         logger.error(f"Failed to update database for customer {customer_id}: {e}")
         # Don't raise - this is non-critical, the status is in memory
 
 
-def _convert_to_loan_application(request: ProcessLoanRequest) -> LoanApplication:
-    """Convert API request to LoanApplication model.
+def _eligibility_score(confidence_score: float, risk_score: float) -> int:
+    """Calculate eligibility score (0-100) from confidence and risk.
+    
+    Higher confidence and lower risk = higher eligibility.
     
     Args:
-        request: API request data
+        confidence_score: Decision confidence (0-1)
+        risk_score: Risk score (0-100)
         
     Returns:
-        LoanApplication instance
+        Eligibility score
     """
-    # Personal information
-    personal_info = PersonalInfo(
-        first_name=request.firstName,
-        last_name=request.lastName,
-        personal_id=request.personalId,
-        gender=Gender(request.gender),
-        birth_year=request.birthYear,
-        phone=request.phone,
-        address=request.address,
-    )
+    return int((confidence_score * 100) * (1 - risk_score / 100))
+
+
+def _status_response(entry: dict) -> dict:
+    """Expand a status entry's progress bits for the API response.
     
-    # Education
-    education = Education(
-        education_level=EducationLevel(request.educationLevel),
-        university=request.university or "Not Specified",
-    )
+    Args:
+        entry: Status entry from application_status
+        
+    Returns:
+        Copy of the entry with progress as a dict of booleans
+    """
+    bits = entry["progress"]
+    return {
+        **entry,
+        "progress": {name: bool(bits & flag) for name, flag in _PROGRESS_FLAGS},
+    }
+
+
+def _get_loan_application(request: ProcessLoanRequest) -> LoanApplication:
+    """Convert a request, reusing the previous result for a replayed payload.
     
-    # Employment
-    employment = Employment(
-        employment_status=EmploymentStatus(request.employmentStatus),
-        company_name=request.companyName,
-        monthly_salary=request.monthlySalary,
-        experience_years=request.experienceYears,
-    )
+    Args:
+        request: API request data
+        
+    Returns:
+        LoanApplication instance
+    """
+    payload = request.model_dump_json()
+    cached = _conversion_cache.get(request.customerId)
+    if cached is not None and cached[0] == payload:
+        return cached[1]
     
-    # Loan request
-    loan_request = LoanRequest(
-        loan_purpose=LoanPurpose(request.loanPurpose),
-        loan_duration=request.loanDuration,
-        loan_amount=request.loanAmount,
-        additional_info=request.additionalInfo,
-    )
+    application = _convert_to_loan_application(request)
+    _conversion_cache[request.customerId] = (payload, application)
+    return application
+
+
+def _convert_to_loan_application(request: ProcessLoanRequest) -> LoanApplication:
+    """Convert API request to LoanApplication model.
     
-    # Documents
+    Args:
+        request: API request data
+        
+    Returns:
+        LoanApplication instance
+    """
+    # Built as one nested payload so pydantic validates the whole tree in a
+    # single model_validate call instead of one constructor per sub-model
+    uploaded_at = datetime.now(timezone.utc)
     documents = []
     if request.bankStatementUrl:
-        documents.append(
-            DocumentInfo(
-                document_type=DocumentType.BANK_STATEMENT,
-                file_name=f"bank_statement_{request.customerId}.pdf",
-                file_path=request.bankStatementUrl,
-                file_size=request.bankStatementSize or 0,
-                mime_type=request.bankStatementMimeType or "application/pdf",
-                uploaded_at=datetime.utcnow(),
-            )
-        )
+        documents.append({
+            "document_type": DocumentType.BANK_STATEMENT,
+            "file_name": f"bank_statement_{request.customerId}.pdf",
+            "file_path": request.bankStatementUrl,
+            "file_size": request.bankStatementSize or 0,
+            "mime_type": request.bankStatementMimeType or "application/pdf",
+            "uploaded_at": uploaded_at,
+        })
     
     if request.salaryStatementUrl:
-        documents.append(
-            DocumentInfo(
-                document_type=DocumentType.SALARY_STATEMENT,
-                file_name=f"salary_statement_{request.customerId}.pdf",
-                file_path=request.salaryStatementUrl,
-                file_size=request.salaryStatementSize or 0,
-                mime_type=request.salaryStatementMimeType or "application/pdf",
-                uploaded_at=datetime.utcnow(),
-            )
-        )
+        documents.append({
+            "document_type": DocumentType.SALARY_STATEMENT,
+            "file_name": f"salary_statement_{request.customerId}.pdf",
+            "file_path": request.salaryStatementUrl,
+            "file_size": request.salaryStatementSize or 0,
+            "mime_type": request.salaryStatementMimeType or "application/pdf",
+            "uploaded_at": uploaded_at,
+        })
     
-    # Create complete application
-    application = LoanApplication(
-        customer_id=request.customerId,
-        personal_info=personal_info,
-        education=education,
-        employment=employment,
-        loan_request=loan_request,
-        documents=documents,
-    )
+    application = LoanApplication.model_validate({
+        "customer_id": request.customerId,
+        "personal_info": {
+            "first_name": request.firstName,
+            "last_name": request.lastName,
+            "personal_id": request.personalId,
+            "gender": _GENDER_MAP[request.gender],
+            "birth_year": request.birthYear,
+            "phone": request.phone,
+            "address": request.address,
+        },
+        "education": {
+            "education_level": _EDUCATION_LEVEL_MAP[request.educationLevel],
+            "university": request.university or "Not Specified",
+        },
+        "employment": {
+            "employment_status": _EMPLOYMENT_STATUS_MAP[request.employmentStatus],
+            "company_name": request.companyName,
+            "monthly_salary": request.monthlySalary,
+            "experience_years": request.experienceYears,
+        },
+        "loan_request": {
+            "loan_purpose": _LOAN_PURPOSE_MAP[request.loanPurpose],
+            "loan_duration": request.loanDuration,
+            "loan_amount": request.loanAmount,
+            "additional_info": request.additionalInfo,
+        },
+        "documents": documents,
+    })
     
     return application
 
@@ -460,13 +699,14 @@ async def get_status(customer_id: str):
     Returns:
         Processing status information
     """
-    if customer_id not in application_status:
+    status_data = application_status.get(customer_id)
+    if status_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No application found for customer ID: {customer_id}"
         )
     
-    return application_status[customer_id]
+    return _status_response(status_data)
 
 
 @app.get("/api/result/{customer_id}", tags=["Results"])
@@ -479,14 +719,13 @@ async def get_result(customer_id: str):
     Returns:
         Final decision result if processing is complete
     """
-    if customer_id not in application_status:
+    status_data = application_status.get(customer_id)
+    if status_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No application found for customer ID: {customer_id}"
         )
     
-    status_data = application_status[customer_id]
-    
     # Check if processing is complete
     if status_data.get("status") != "completed":
         raise HTTPException(
@@ -499,16 +738,61 @@ async def get_result(customer_id: str):
 
 
 @app.get("/api/applications", tags=["Status"])
-async def list_applications():
-    """List all loan applications and their statuses.
+async def list_applications(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_APPLICATIONS_PAGE),
+    response_format: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+):
+    """List tracked loan applications and their statuses.
+    
+    Results are paginated. The JSON body carries ``total`` and
+    ``next_offset`` (None on the last page); both formats also send an
+    ``X-Total-Count`` header and, when more applications follow, a
+    ``Link: <...>; rel="next"`` header.
     
+    Args:
+        request: Incoming request, used to build the next-page link
+        offset: Number of applications to skip
+        limit: Maximum number of applications to return
+        response_format: "json" for a single document, "ndjson" to stream
+            one application per line
+        
     Returns:
-        List of all applications with their current status
+        Total application count and one page of applications
     """
-    return {
-        "count": len(application_status),
-        "applications": list(application_status.values())
-    }
+    # Snapshot the page first: the store may change while the body is written
+    page = [
+        _status_response(entry)
+        for entry in islice(application_status.values(), offset, offset + limit)
+    ]
+    total = len(application_status)
+    next_offset = offset + len(page) if offset + len(page) < total else None
+
+    headers = {"X-Total-Count": str(total)}
+    if next_offset is not None:
+        next_url = request.url.include_query_params(offset=next_offset, limit=limit)
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    
+    if response_format == "ndjson":
+        return StreamingResponse(
+            (orjson.dumps(entry) + b"\n" for entry in page),
+            media_type="application/x-ndjson",
+            headers=headers,
+        )
+    
+    # Entries hold only JSON-native values, so skip jsonable_encoder
+    return ORJSONResponse(
+        content={
+            "count": total,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+            "applications": page,
+        },
+        headers=headers,
+    )
 
 
 @app.get("/", tags=["Root"])
@@ -526,10 +810,23 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
     
+    # loop="auto" uses uvloop where it is installed (it is not on Windows)
+    # and falls back to asyncio. Auto-reload is a development convenience and
+    # stays off elsewhere. Status tracking is in-memory per process, so run
+    # more than one worker only behind sticky routing.
+    reload = settings.environment == "development"
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    if reload and workers > 1:
+        # uvicorn silently ignores workers when reloading; say so instead
+        logger.warning("Ignoring UVICORN_WORKERS={}: auto-reload runs a single worker", workers)
+        workers = 1
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
         log_level="info",
+        loop="auto",
+        http="httptools",
+        workers=workers,
     )
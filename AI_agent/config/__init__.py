@@ -1,5 +1,5 @@
 """Configuration package initialization."""
 
-from config.settings import Settings, settings
+from config.settings import Settings, SettingsSnapshot, settings
 
-__all__ = ["Settings", "settings"]
+__all__ = ["Settings", "SettingsSnapshot", "settings"]
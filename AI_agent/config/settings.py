@@ -1,5 +1,6 @@
 """Application settings and configuration management."""
 
+from dataclasses import make_dataclass
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -39,6 +40,8 @@ class Settings(BaseSettings):
     max_agent_discussion_rounds: int = 3
     consensus_threshold: float = 0.6
     timeout_seconds: int = 300
+    # JSON file written by ThresholdCalibrator; defaults are used when unset
+    decision_thresholds_path: Optional[str] = None
 
     # Database
     database_url: Optional[str] = None
@@ -57,5 +60,15 @@ class Settings(BaseSettings):
         extra = "ignore"  # Allow extra fields in .env file
 
 
+# Read-only snapshot of the loaded settings: a frozen, slotted dataclass with
+# the same fields, so lookups skip the pydantic model machinery and nothing
+# can mutate configuration at runtime.
+SettingsSnapshot = make_dataclass(
+    "SettingsSnapshot",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
 # Global settings instance
-settings = Settings()
+settings = SettingsSnapshot(**Settings().model_dump())
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import datetime
 
-from loanai_agent.main import LoanApplicationProcessor
+from loanai_agent.main import get_processor
 from loanai_agent.models import (
     DocumentInfo,
     DocumentType,
@@ -98,7 +98,7 @@ async def run_demo():
     logger.info("=" * 80)
 
     # Initialize processor
-    processor = LoanApplicationProcessor()
+    processor = get_processor()
     logger.info("✓ Loan Application Processor initialized")
 
     # Check system status
@@ -1,5 +1,5 @@
 """LoanAI Agent system package initialization."""
 
-from loanai_agent.main import LoanApplicationProcessor
+from loanai_agent.main import LoanApplicationProcessor, get_processor
 
-__all__ = ["LoanApplicationProcessor"]
+__all__ = ["LoanApplicationProcessor", "get_processor"]
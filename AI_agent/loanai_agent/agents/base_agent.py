@@ -2,7 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from loanai_agent.models import DecisionResult, LoanApplication
 from loanai_agent.utils import AgentException, get_logger
@@ -13,6 +13,8 @@ logger = get_logger(__name__)
 class BaseAgent(ABC):
     """Base class for all agents."""
 
+    __slots__ = ("name", "description", "model", "temperature", "logger", "_system_prompt")
+
     def __init__(
         self,
         name: str,
@@ -33,6 +35,7 @@ class BaseAgent(ABC):
         self.model = model
         self.temperature = temperature
         self.logger = get_logger(name)
+        self._system_prompt = f"You are a {description} agent. Be thorough and objective."
 
     async def analyze(
         self, application: LoanApplication, **kwargs: Any
@@ -46,15 +49,42 @@ class BaseAgent(ABC):
         Returns:
             Analysis result dictionary
         """
-        self.logger.info(f"Starting analysis for customer: {application.customer_id}")
+        self.logger.info("Starting analysis for customer: {}", application.customer_id)
         try:
             result = await self._perform_analysis(application, **kwargs)
-            self.logger.info(f"Analysis completed for customer: {application.customer_id}")
+            self.logger.info("Analysis completed for customer: {}", application.customer_id)
             return result
         except Exception as e:
-            self.logger.error(f"Analysis failed: {e}")
+            self.logger.error("Analysis failed: {}", e)
             raise AgentException(f"{self.name} analysis failed: {str(e)}")
 
+    async def run_batch_async(
+        self, applications: List[LoanApplication], max_concurrency: int = 16
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Analyze several applications concurrently.
+        
+        At most ``max_concurrency`` analyses are in flight at once, which
+        overlaps LLM wait time across the batch while respecting provider
+        rate limits.
+        
+        Args:
+            applications: Loan applications to analyze
+            max_concurrency: Maximum number of concurrent analyses
+            
+        Returns:
+            Results in input order; a failed analysis is returned as its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(application: LoanApplication) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze(application)
+
+        return await asyncio.gather(
+            *(analyze_one(application) for application in applications),
+            return_exceptions=True,
+        )
+
     @abstractmethod
     async def _perform_analysis(
         self, application: LoanApplication, **kwargs: Any
@@ -64,7 +94,7 @@ class BaseAgent(ABC):
 
     def get_system_prompt(self) -> str:
         """Get system prompt for the agent."""
-        return f"You are a {self.description} agent. Be thorough and objective."
+        return self._system_prompt
 
     def __repr__(self) -> str:
         """String representation of agent."""
@@ -74,6 +104,8 @@ class BaseAgent(ABC):
 class DecisionAgent(BaseAgent, ABC):
     """Base class for agents that make decisions."""
 
+    __slots__ = ()
+
     async def make_decision(
         self, analysis_results: Dict[str, Any], context: Optional[Dict] = None
     ) -> Dict[str, Any]:
@@ -86,12 +118,12 @@ class DecisionAgent(BaseAgent, ABC):
         Returns:
             Decision result
         """
-        self.logger.info(f"Making decision in {self.name}")
+        self.logger.info("Making decision in {}", self.name)
         try:
             decision = await self._generate_decision(analysis_results, context)
             return decision
         except Exception as e:
-            self.logger.error(f"Decision generation failed: {e}")
+            self.logger.error("Decision generation failed: {}", e)
             raise AgentException(f"Decision generation in {self.name} failed: {str(e)}")
 
     @abstractmethod
@@ -105,6 +137,8 @@ class DecisionAgent(BaseAgent, ABC):
 class AnalysisAgent(BaseAgent, ABC):
     """Base class for agents that perform analysis."""
 
+    __slots__ = ()
+
     async def get_confidence_score(self, analysis: Dict[str, Any]) -> float:
         """Calculate confidence score for analysis (0-1).
         
@@ -1,17 +1,105 @@
 """Loan Officer Agent - Main Orchestrator implementation."""
 
-from typing import Any, Dict, List, Optional
-
+import asyncio
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import settings
 from loanai_agent.agents.base_agent import DecisionAgent
 from loanai_agent.models import ConsensusResult, DecisionResult, LoanApplication
+from loanai_agent.protocols.calibration import DecisionThresholds
 from loanai_agent.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+def _now() -> datetime:
+    """Current time for decision timestamps; patched in tests."""
+    return datetime.now()
+
+
+# Decisions indexed by bisect_right over DecisionThresholds.risk_thresholds
+_RISK_DECISIONS = ("APPROVED", "MANUAL_REVIEW", "REJECTED")
+
+# Loan condition bit flags, rendered in this order by _generate_conditions
+CONDITION_INCOME_VERIFICATION = 1
+CONDITION_COLLATERAL = 2
+CONDITION_REFERENCES = 4
+CONDITION_FRAUD_INVESTIGATION = 8
+_CONDITION_TEXTS = (
+    (CONDITION_INCOME_VERIFICATION, "Require income verification"),
+    (CONDITION_COLLATERAL, "Require collateral evaluation"),
+    (CONDITION_REFERENCES, "Require additional references"),
+    (CONDITION_FRAUD_INVESTIGATION, "Subject to fraud investigation"),
+)
+
+# (analysis result key, keyword argument carrying the sub-agent)
+_SUB_AGENTS = (
+    ("bank_analysis", "bank_agent"),
+    ("salary_analysis", "salary_agent"),
+    ("verification_analysis", "verification_agent"),
+)
+
+# analysis_results keys in AnalysisBundle field order, extracted in one C call
+_BUNDLE_KEYS = (
+    "bank_analysis",
+    "salary_analysis",
+    "verification_analysis",
+    "consensus",
+    "application",
+)
+_extract_bundle = itemgetter(*_BUNDLE_KEYS)
+_BUNDLE_DEFAULTS = dict.fromkeys(_BUNDLE_KEYS)
+
+_LOAN_OFFICER_SYSTEM_PROMPT = """You are a senior loan officer with 20 years of experience in financial analysis 
+and risk assessment, Be aware that you work in Georgia and make decisions accordingly. Your role is to review loan applications, analyze sub-agent 
+reports, and make final decisions on loan approvals or rejections.
+
+Key responsibilities:
+1. Review and aggregate sub-agent analysis results
+2. Calculate comprehensive risk scores
+3. Make final approval/rejection decisions
+4. Generate detailed explanations for every decision
+5. Ensure compliance with lending regulations
+6. Consider contextual factors and edge cases
+
+Always be thorough, fair, and objective. Provide detailed reasoning for all decisions.
+Your decisions must be legally defensible and ethically sound."""
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisBundle:
+    """Sub-agent analyses for one decision, extracted once from the results dict."""
+
+    bank: Optional[Dict[str, Any]] = None
+    salary: Optional[Dict[str, Any]] = None
+    verification: Optional[Dict[str, Any]] = None
+    consensus: Optional[Dict[str, Any]] = None
+    application: Optional[LoanApplication] = None
+
+    @classmethod
+    def from_results(cls, analysis_results: Dict[str, Any]) -> "AnalysisBundle":
+        """Build a bundle from the combined ``analysis_results`` dict."""
+        try:
+            return cls(*_extract_bundle(analysis_results))
+        except KeyError:
+            # Some analyses are missing; fill them in as None
+            return cls(*_extract_bundle({**_BUNDLE_DEFAULTS, **analysis_results}))
+
+
 class LoanOfficerAgent(DecisionAgent):
     """Main orchestrator agent responsible for final loan decisions."""
 
+    __slots__ = ("thresholds",)
+
+    # Deliberation limits: stop after one round once this fraction of the
+    # sub-agents agree, and never run more than max_consensus_rounds
+    consensus_threshold = 0.85
+    max_consensus_rounds = 2
+
     def __init__(self):
         """Initialize Loan Officer Agent."""
         super().__init__(
@@ -20,22 +108,67 @@ class LoanOfficerAgent(DecisionAgent):
             model="gemini-3.0-pro-preview",
             temperature=0,
         )
+        self.thresholds = self._load_thresholds(settings.decision_thresholds_path)
+
+    def _load_thresholds(self, path: Optional[str]) -> DecisionThresholds:
+        """Load calibrated decision thresholds, falling back to the defaults."""
+        if not path:
+            return DecisionThresholds()
+        try:
+            thresholds = DecisionThresholds.load(path)
+            self.logger.info(f"Loaded decision thresholds from {path}: {thresholds}")
+            return thresholds
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Could not load decision thresholds from {path}: {e}")
+            return DecisionThresholds()
 
     async def _perform_analysis(
         self, application: LoanApplication, **kwargs: Any
     ) -> Dict[str, Any]:
         """Orchestrate the analysis process.
         
+        Sub-agents passed as keyword arguments (``bank_agent``,
+        ``salary_agent``, ``verification_agent``) are run concurrently, so
+        the wall-clock cost is that of the slowest agent rather than the sum.
+        
         Args:
             application: Loan application to process
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments, including optional sub-agents
             
         Returns:
-            Orchestration result
+            Orchestration result with the sub-agent analyses keyed by name
         """
-        self.logger.info(f"Orchestrating analysis for {application.customer_id}")
-        # Loan Officer mainly orchestrates, actual analysis is done by sub-agents
-        return {"status": "ready_for_decision"}
+        self.logger.info("Orchestrating analysis for {}", application.customer_id)
+
+        agents = {
+            name: kwargs[key]
+            for name, key in _SUB_AGENTS
+            if kwargs.get(key) is not None
+        }
+        if not agents:
+            # Loan Officer mainly orchestrates, actual analysis is done by sub-agents
+            return {"status": "ready_for_decision"}
+
+        # return_exceptions keeps one failing agent from cancelling the others
+        results = await asyncio.gather(
+            *(agent.analyze(application) for agent in agents.values()),
+            return_exceptions=True,
+        )
+
+        analysis_results: Dict[str, Any] = {
+            "status": "ready_for_decision",
+            "application": application,
+        }
+        for name, result in zip(agents, results):
+            if isinstance(result, Exception):
+                # Leave the key out so decision helpers treat it as missing
+                self.logger.error("{} failed with exception: {}", name, result)
+            elif hasattr(result, "model_dump"):
+                analysis_results[name] = result.model_dump()
+            else:
+                analysis_results[name] = result
+
+        return analysis_results
 
     async def _generate_decision(
         self, analysis_results: Dict[str, Any], context: Optional[Dict] = None
@@ -51,55 +184,25 @@ class LoanOfficerAgent(DecisionAgent):
         """
         self.logger.info("Generating final decision")
 
-        # Extract individual analyses
-        bank_analysis = analysis_results.get("bank_analysis")
-        salary_analysis = analysis_results.get("salary_analysis")
-        verification_analysis = analysis_results.get("verification_analysis")
-        consensus = analysis_results.get("consensus")
-        application = analysis_results.get("application")
+        # Extract individual analyses once; helpers read the bundle's slots
+        b = AnalysisBundle.from_results(analysis_results)
 
         # Calculate overall metrics
-        overall_risk_score = self._calculate_overall_risk(
-            bank_analysis, salary_analysis, verification_analysis, consensus
-        )
-
-        overall_confidence = self._calculate_overall_confidence(
-            bank_analysis, salary_analysis, verification_analysis, consensus
-        )
+        overall_risk_score, overall_confidence = self._aggregate_metrics(b)
 
-        # Make decision
-        decision = self._make_final_decision(
-            overall_risk_score,
-            overall_confidence,
-            consensus,
-            bank_analysis,
-            salary_analysis,
-            verification_analysis,
-        )
-
-        # Check for override conditions
-        override_result = self._check_override_conditions(
-            analysis_results, decision
-        )
-        if override_result:
-            decision = override_result
+        # Override conditions (e.g. document fraud) decide on their own, so
+        # check them first and only run the threshold logic when none apply
+        decision = self._check_override_conditions(b)
+        if decision is None:
+            decision = self._make_final_decision(overall_risk_score, overall_confidence, b)
 
         # Calculate loan terms
         loan_terms = None
         if decision.get("decision") == "APPROVED":
-            loan_terms = self._calculate_loan_terms(
-                application, overall_risk_score, analysis_results
-            )
+            loan_terms = self._calculate_loan_terms(b, overall_risk_score)
 
         # Generate detailed explanation
-        reasoning = self._generate_decision_reasoning(
-            decision,
-            overall_risk_score,
-            bank_analysis,
-            salary_analysis,
-            verification_analysis,
-            consensus,
-        )
+        reasoning = self._generate_decision_reasoning(decision, overall_risk_score, b)
 
         final_result = {
             "decision": decision.get("decision"),
@@ -111,103 +214,61 @@ class LoanOfficerAgent(DecisionAgent):
             "conditions": loan_terms.get("conditions", []) if loan_terms else [],
             "reasoning": reasoning,
             "detailed_report": {
-                "bank_analysis": bank_analysis,
-                "salary_analysis": salary_analysis,
-                "verification_analysis": verification_analysis,
-                "consensus": consensus,
-                "decision_timestamp": str(__import__("datetime").datetime.now()),
+                "bank_analysis": b.bank,
+                "salary_analysis": b.salary,
+                "verification_analysis": b.verification,
+                "consensus": b.consensus,
+                "decision_timestamp": _now().isoformat(timespec="seconds"),
                 "decision_officer": self.name,
             },
         }
 
         return final_result
 
-    def _calculate_overall_risk(
-        self,
-        bank_analysis: Optional[Dict],
-        salary_analysis: Optional[Dict],
-        verification_analysis: Optional[Dict],
-        consensus: Optional[Dict],
-    ) -> int:
-        """Calculate overall risk score from all analyses."""
-        risk_scores = []
-
-        if bank_analysis:
-            risk_scores.append(bank_analysis.get("risk_score", 50))
-        if salary_analysis:
-            risk_scores.append(salary_analysis.get("risk_score", 50))
-        if verification_analysis:
-            risk_scores.append(verification_analysis.get("risk_score", 50))
-
-        if risk_scores:
-            # Weighted average
-            overall_risk = sum(risk_scores) / len(risk_scores)
-            # Apply consensus weight if available
-            if consensus:
-                overall_risk = (overall_risk * 0.7) + (consensus.get("risk_score", 50) * 0.3)
-            return int(overall_risk)
-
-        return 50
-
-    def _calculate_overall_confidence(
-        self,
-        bank_analysis: Optional[Dict],
-        salary_analysis: Optional[Dict],
-        verification_analysis: Optional[Dict],
-        consensus: Optional[Dict],
-    ) -> float:
-        """Calculate overall confidence from all analyses."""
-        confidence_scores = []
-
-        if bank_analysis:
-            confidence_scores.append(bank_analysis.get("confidence_score", 0.5))
-        if salary_analysis:
-            confidence_scores.append(salary_analysis.get("confidence_score", 0.5))
-        if verification_analysis:
-            confidence_scores.append(verification_analysis.get("confidence_score", 0.5))
-
-        if confidence_scores:
-            # Average confidence
-            overall_confidence = sum(confidence_scores) / len(confidence_scores)
-            # Apply consensus weight if available
-            if consensus:
-                overall_confidence = (
-                    (overall_confidence * 0.7)
-                    + (consensus.get("confidence_score", 0.5) * 0.3)
-                )
-            return overall_confidence
-
-        return 0.5
+    def _aggregate_metrics(self, b: AnalysisBundle) -> Tuple[int, float]:
+        """Calculate overall risk score and confidence in one pass.
+
+        Averages the available sub-agent scores and, when a consensus is
+        present, blends it in at 30% weight.
+        """
+        risk_total = 0
+        confidence_total = 0.0
+        count = 0
+        for analysis in (b.bank, b.salary, b.verification):
+            if analysis:
+                risk_total += analysis.get("risk_score", 50)
+                confidence_total += analysis.get("confidence_score", 0.5)
+                count += 1
+
+        if not count:
+            return 50, 0.5
+
+        overall_risk = risk_total / count
+        overall_confidence = confidence_total / count
+        # Apply consensus weight if available
+        if b.consensus:
+            overall_risk = (overall_risk * 0.7) + (b.consensus.get("risk_score", 50) * 0.3)
+            overall_confidence = (
+                (overall_confidence * 0.7)
+                + (b.consensus.get("confidence_score", 0.5) * 0.3)
+            )
+        return int(overall_risk), overall_confidence
 
     def _make_final_decision(
-        self,
-        risk_score: int,
-        confidence: float,
-        consensus: Optional[Dict],
-        bank_analysis: Optional[Dict],
-        salary_analysis: Optional[Dict],
-        verification_analysis: Optional[Dict],
+        self, risk_score: int, confidence: float, b: AnalysisBundle
     ) -> Dict[str, str]:
         """Make final decision based on metrics."""
         # Decision thresholds
-        if risk_score < 20:
-            decision = "APPROVED"
-        elif risk_score < 40:
-            decision = "APPROVED"
-        elif risk_score < 60:
-            decision = "MANUAL_REVIEW"
-        elif risk_score < 75:
-            decision = "REJECTED"
-        else:
-            decision = "REJECTED"
+        thresholds = self.thresholds
+        decision = _RISK_DECISIONS[bisect_right(thresholds.risk_thresholds, risk_score)]
 
         # Adjust based on confidence
-        if confidence < 0.6 and decision != "REJECTED":
+        if confidence < thresholds.confidence_cutoff and decision != "REJECTED":
             decision = "MANUAL_REVIEW"
 
         # Check consensus
-        if consensus:
-            consensus_rec = consensus.get("overall_recommendation", "manual_review")
+        if b.consensus:
+            consensus_rec = b.consensus.get("overall_recommendation", "manual_review")
             if consensus_rec == "reject":
                 decision = "REJECTED"
             elif consensus_rec == "approve" and decision == "MANUAL_REVIEW":
@@ -216,34 +277,29 @@ class LoanOfficerAgent(DecisionAgent):
 
         return {"decision": decision}
 
-    def _check_override_conditions(
-        self, analysis_results: Dict[str, Any], decision: Dict[str, str]
-    ) -> Optional[Dict[str, str]]:
+    def _check_override_conditions(self, b: AnalysisBundle) -> Optional[Dict[str, str]]:
         """Check for override conditions that change the decision."""
-        bank_analysis = analysis_results.get("bank_analysis", {})
-        salary_analysis = analysis_results.get("salary_analysis", {})
+        bank_flags = b.bank.get("red_flags") if b.bank else None
+        salary_flags = b.salary.get("red_flags") if b.salary else None
 
         # Document fraud detected
-        if bank_analysis.get("red_flags") or salary_analysis.get("red_flags"):
-            major_red_flags = (
-                len(bank_analysis.get("red_flags", [])) + 
-                len(salary_analysis.get("red_flags", []))
-            )
+        if bank_flags or salary_flags:
+            major_red_flags = len(bank_flags or ()) + len(salary_flags or ())
             if major_red_flags > 2:
                 self.logger.warning("Multiple red flags detected - rejecting application")
                 return {"decision": "REJECTED"}
 
         return None
 
-    def _calculate_loan_terms(
-        self, application: Optional[Any], risk_score: int, analysis_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _calculate_loan_terms(self, b: AnalysisBundle, risk_score: int) -> Dict[str, Any]:
         """Calculate loan terms based on risk and application."""
-        if not application:
+        application = b.application
+        if application is None or application.loan_request is None:
             return {}
 
-        loan_amount = getattr(application, "loan_request", {}).loan_amount
-        loan_duration = getattr(application, "loan_request", {}).loan_duration
+        loan_request = application.loan_request
+        loan_amount = loan_request.loan_amount
+        loan_duration = loan_request.loan_duration
 
         # Calculate interest rate based on risk score
         base_rate = 5.0  # 5% base rate
@@ -253,36 +309,26 @@ class LoanOfficerAgent(DecisionAgent):
             "loan_amount": loan_amount,
             "interest_rate": round(risk_adjusted_rate, 2),
             "loan_duration": loan_duration,
-            "conditions": self._generate_conditions(risk_score, analysis_results),
+            "conditions": self._generate_conditions(risk_score, b),
         }
 
-    def _generate_conditions(
-        self, risk_score: int, analysis_results: Dict[str, Any]
-    ) -> List[str]:
+    def _generate_conditions(self, risk_score: int, b: AnalysisBundle) -> List[str]:
         """Generate loan conditions based on risk."""
-        conditions = []
+        flags = 0
 
         if risk_score > 60:
-            conditions.append("Require income verification")
-            conditions.append("Require collateral evaluation")
+            flags |= CONDITION_INCOME_VERIFICATION | CONDITION_COLLATERAL
 
         if risk_score > 40:
-            conditions.append("Require additional references")
+            flags |= CONDITION_REFERENCES
 
-        bank_analysis = analysis_results.get("bank_analysis", {})
-        if bank_analysis.get("red_flags"):
-            conditions.append("Subject to fraud investigation")
+        if b.bank and b.bank.get("red_flags"):
+            flags |= CONDITION_FRAUD_INVESTIGATION
 
-        return conditions
+        return [text for flag, text in _CONDITION_TEXTS if flags & flag]
 
     def _generate_decision_reasoning(
-        self,
-        decision: Dict[str, str],
-        overall_risk: int,
-        bank_analysis: Optional[Dict],
-        salary_analysis: Optional[Dict],
-        verification_analysis: Optional[Dict],
-        consensus: Optional[Dict],
+        self, decision: Dict[str, str], overall_risk: int, b: AnalysisBundle
     ) -> str:
         """Generate detailed reasoning for the decision."""
         parts = []
@@ -290,41 +336,28 @@ class LoanOfficerAgent(DecisionAgent):
         parts.append(f"Final Decision: {decision.get('decision')}")
         parts.append(f"Overall Risk Score: {overall_risk}/100")
 
-        if bank_analysis:
+        if b.bank:
             parts.append(
-                f"Financial Analysis: {bank_analysis.get('reasoning', 'N/A')}"
+                f"Financial Analysis: {b.bank.get('reasoning', 'N/A')}"
             )
 
-        if salary_analysis:
+        if b.salary:
             parts.append(
-                f"Employment Analysis: {salary_analysis.get('reasoning', 'N/A')}"
+                f"Employment Analysis: {b.salary.get('reasoning', 'N/A')}"
             )
 
-        if verification_analysis:
+        if b.verification:
             parts.append(
-                f"Verification: {verification_analysis.get('reasoning', 'N/A')}"
+                f"Verification: {b.verification.get('reasoning', 'N/A')}"
             )
 
-        if consensus:
+        if b.consensus:
             parts.append(
-                f"Agent Consensus: {consensus.get('discussion_summary', 'N/A')}"
+                f"Agent Consensus: {b.consensus.get('discussion_summary', 'N/A')}"
             )
 
         return "\n".join(parts)
 
     def get_system_prompt(self) -> str:
         """Get system prompt for this agent."""
-        return """You are a senior loan officer with 20 years of experience in financial analysis 
-and risk assessment, Be aware that you work in Georgia and make decisions accordingly. Your role is to review loan applications, analyze sub-agent 
-reports, and make final decisions on loan approvals or rejections.
-
-Key responsibilities:
-1. Review and aggregate sub-agent analysis results
-2. Calculate comprehensive risk scores
-3. Make final approval/rejection decisions
-4. Generate detailed explanations for every decision
-5. Ensure compliance with lending regulations
-6. Consider contextual factors and edge cases
-
-Always be thorough, fair, and objective. Provide detailed reasoning for all decisions.
-Your decisions must be legally defensible and ethically sound."""
+        return _LOAN_OFFICER_SYSTEM_PROMPT
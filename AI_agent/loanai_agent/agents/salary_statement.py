@@ -1,18 +1,36 @@
 """Salary Statement Analysis Agent implementation."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from loanai_agent.agents.base_agent import AnalysisAgent
-from loanai_agent.models import LoanApplication, SalaryStatementAnalysis
-from loanai_agent.tools import DocumentProcessor, EmploymentVerifier
+from loanai_agent.models import DocumentType, LoanApplication, SalaryStatementAnalysis
+from loanai_agent.tools import EmploymentVerifier, get_document_processor
 from loanai_agent.utils import get_logger
 
 logger = get_logger(__name__)
 
+_SALARY_STATEMENT_SYSTEM_PROMPT = """You are an HR specialist and employment verification expert with deep knowledge 
+of salary statements, employment law, and compensation structures.
+
+Key responsibilities:
+1. Extract and validate employment information from salary statements
+2. Verify employer legitimacy and employment status
+3. Cross-reference stated salary with actual documented income
+4. Calculate employment stability and tenure indicators
+5. Assess employment security and risk factors
+6. Analyze benefits and deductions for legitimacy
+7. Detect employment verification discrepancies
+
+Be thorough in cross-referencing information. Provide confidence scores and 
+flag any inconsistencies or concerns."""
+
 
 class SalaryStatementAgent(AnalysisAgent):
     """Agent specialized in analyzing salary statements and employment verification."""
 
+    __slots__ = ("document_processor", "employment_verifier")
+
     def __init__(self):
         """Initialize Salary Statement Agent."""
         super().__init__(
@@ -21,7 +39,7 @@ class SalaryStatementAgent(AnalysisAgent):
             model="gemini-2.0-flash-exp",
             temperature=0.1,
         )
-        self.document_processor = DocumentProcessor()
+        self.document_processor = get_document_processor()
         self.employment_verifier = EmploymentVerifier()
 
     async def _perform_analysis(
@@ -38,14 +56,7 @@ class SalaryStatementAgent(AnalysisAgent):
         """
         try:
             # Extract salary statement document
-            salary_doc = next(
-                (
-                    d
-                    for d in application.documents
-                    if d.document_type.value == "salary_statement"
-                ),
-                None,
-            )
+            salary_doc = application.documents_by_type.get(DocumentType.SALARY_STATEMENT)
 
             if not salary_doc:
                 self.logger.warning("No salary statement document found")
@@ -55,33 +66,34 @@ class SalaryStatementAgent(AnalysisAgent):
                     "risk_score": 100,
                 }
 
-            # Parse document directly with LLM (no need for intermediate text extraction)
-            parsed_data = self.document_processor.parse_salary_statement(salary_doc.file_path)
+            # Parse document directly with LLM (no need for intermediate text
+            # extraction). Parsing is blocking I/O, so run it off the event loop
+            parsed_data = await asyncio.to_thread(
+                self.document_processor.parse_salary_statement, salary_doc.file_path
+            )
 
             # Perform analysis
             analysis = await self._analyze_salary_data(
                 parsed_data,
                 application.employment,
-                application.personal_info.first_name,
-                application.personal_info.last_name,
+                application.personal_info.full_name_lower,
             )
 
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Salary statement analysis failed: {e}")
+            self.logger.error("Salary statement analysis failed: {}", e)
             raise
 
     async def _analyze_salary_data(
-        self, salary_data: Dict[str, Any], employment_info: Any, first_name: str, last_name: str
+        self, salary_data: Dict[str, Any], employment_info: Any, full_name_lower: str
     ) -> Dict[str, Any]:
         """Analyze parsed salary data.
         
         Args:
             salary_data: Parsed salary statement data
             employment_info: Employment information from application
-            first_name: Employee's first name
-            last_name: Employee's last name
+            full_name_lower: Applicant's lower-cased "first last" name
             
         Returns:
             Detailed analysis result
@@ -89,8 +101,7 @@ class SalaryStatementAgent(AnalysisAgent):
         self.logger.info("Analyzing salary statement data")
 
         employee_name_match = (
-            f"{salary_data.get('employee_name', '')}".lower()
-            == f"{first_name} {last_name}".lower()
+            f"{salary_data.get('employee_name', '')}".lower() == full_name_lower
         )
 
         gross_salary = salary_data.get("gross_salary", 0)
@@ -102,18 +113,11 @@ class SalaryStatementAgent(AnalysisAgent):
             reported_salary, gross_salary, threshold=0.15
         )
 
-        if salary_matches:
-            salary_variance = abs(
-                (reported_salary - gross_salary) / gross_salary * 100
-                if gross_salary > 0
-                else 0
-            )
-        else:
-            salary_variance = abs(
-                (reported_salary - gross_salary) / gross_salary * 100
-                if gross_salary > 0
-                else 0
-            )
+        salary_variance = (
+            abs((reported_salary - gross_salary) / gross_salary * 100)
+            if gross_salary > 0
+            else 0.0
+        )
 
         # Calculate employment stability
         tenure_months = employment_info.experience_years * 12 if employment_info.experience_years else 0
@@ -220,17 +224,4 @@ class SalaryStatementAgent(AnalysisAgent):
 
     def get_system_prompt(self) -> str:
         """Get system prompt for this agent."""
-        return """You are an HR specialist and employment verification expert with deep knowledge 
-of salary statements, employment law, and compensation structures.
-
-Key responsibilities:
-1. Extract and validate employment information from salary statements
-2. Verify employer legitimacy and employment status
-3. Cross-reference stated salary with actual documented income
-4. Calculate employment stability and tenure indicators
-5. Assess employment security and risk factors
-6. Analyze benefits and deductions for legitimacy
-7. Detect employment verification discrepancies
-
-Be thorough in cross-referencing information. Provide confidence scores and 
-flag any inconsistencies or concerns."""
+        return _SALARY_STATEMENT_SYSTEM_PROMPT
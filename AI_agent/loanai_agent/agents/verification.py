@@ -1,18 +1,57 @@
 """Verification Agent implementation (MCP-Enabled)."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from loanai_agent.agents.base_agent import AnalysisAgent
 from loanai_agent.models import LoanApplication, VerificationAnalysis
-from loanai_agent.tools import ExternalDataFetcher, WebVerificationTools
+from loanai_agent.tools import get_data_fetcher, get_web_tools
 from loanai_agent.utils import get_logger
 
 logger = get_logger(__name__)
 
+_VERIFICATION_SYSTEM_PROMPT = """You are a verification specialist with access to web search and external APIs.
+Your job is to verify customer-provided information using reliable external sources.
+
+Key responsibilities:
+1. Verify university reputation and accreditation
+2. Validate company existence and legitimacy
+3. Check employer reviews and financial health
+4. Verify address authenticity using geocoding
+5. Benchmark salary against market data
+6. Cross-reference identity information
+7. Gather market intelligence for assessment
+
+Use multiple sources and cite your references. Be thorough and objective.
+Clearly distinguish between verified, partially verified, and unverified information."""
+
+# Confidence contributed by each check. Unknown university/company legitimacy
+# scores 0.6; "assumed_legitimate" is trusted almost as much as "verified".
+_LEGITIMACY_SCORES = {"verified": 1.0, "assumed_legitimate": 0.9}
+_UNVERIFIED_LEGITIMACY_SCORE = 0.6
+_ADDRESS_SCORES = (0.5, 1.0)  # indexed by address validity
+
+# Red flag rules: (lookup result, field, accepted values, flag otherwise).
+# "assumed_legitimate" is accepted, so only explicitly unverified
+# universities and companies are flagged.
+_RED_FLAG_RULES = (
+    ("university", "legitimacy", frozenset(_LEGITIMACY_SCORES), "University could not be verified"),
+    ("company", "legitimacy", frozenset(_LEGITIMACY_SCORES), "Company could not be verified"),
+    ("address", "valid", frozenset({True}), "Address could not be verified"),
+)
+
+# Fields copied from each lookup result into the compiled analysis
+_UNIVERSITY_FIELDS = ("name", "country", "ranking", "accredited", "legitimacy")
+_COMPANY_FIELDS = ("name", "industry", "employees", "founded", "legitimacy", "rating")
+_ADDRESS_FIELDS = ("address", "valid", "geocoded", "city", "state", "zip_code")
+_SALARY_BENCHMARK_FIELDS = ("job_title", "location", "salary_range", "data_points", "confidence")
+
 
 class VerificationAgent(AnalysisAgent):
     """Agent specialized in external verification using web search and APIs."""
 
+    __slots__ = ("web_tools", "data_fetcher")
+
     def __init__(self):
         """Initialize Verification Agent."""
         super().__init__(
@@ -21,8 +60,8 @@ class VerificationAgent(AnalysisAgent):
             model="gemini-2.0-flash-exp",
             temperature=0.2,
         )
-        self.web_tools = WebVerificationTools()
-        self.data_fetcher = ExternalDataFetcher()
+        self.web_tools = get_web_tools()
+        self.data_fetcher = get_data_fetcher()
 
     async def _perform_analysis(
         self, application: LoanApplication, **kwargs: Any
@@ -38,21 +77,25 @@ class VerificationAgent(AnalysisAgent):
         """
         try:
             self.logger.info(
-                f"Starting external verification for customer: {application.customer_id}"
+                "Starting external verification for customer: {}", application.customer_id
             )
 
-            # Perform parallel verifications
-            university_result = self.web_tools.verify_university(
-                application.education.university
-            )
-            company_result = self.web_tools.verify_company(
-                application.employment.company_name or ""
-            )
-            address_result = self.web_tools.verify_address(application.personal_info.address)
+            company_name = application.employment.company_name or ""
+            # verify_company echoes the name it was given, so the benchmark
+            # does not need to wait for the company lookup
             salary_benchmark = self.web_tools.benchmark_salary(
                 "Software Engineer",  # Example, would be extracted from data
                 "San Francisco",
-                company_result.get("name", ""),
+                company_name,
+            )
+
+            # Perform parallel verifications. The web tools make blocking
+            # HTTP calls, so each runs on its API's lookup pool and the latency
+            # is that of the slowest lookup rather than the sum
+            university_result, company_result, address_result = await asyncio.gather(
+                self.web_tools.verify_university_async(application.education.university),
+                self.web_tools.verify_company_async(company_name),
+                self.web_tools.verify_address_async(application.personal_info.address),
             )
 
             # Compile results
@@ -67,7 +110,7 @@ class VerificationAgent(AnalysisAgent):
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Verification analysis failed: {e}")
+            self.logger.error("Verification analysis failed: {}", e)
             raise
 
     async def _compile_verification_results(
@@ -93,39 +136,16 @@ class VerificationAgent(AnalysisAgent):
         self.logger.info("Compiling verification results")
 
         # Calculate confidence and risk based on verification results
-        verification_scores = []
-
-        # University verification
         university_legitimacy = university_result.get("legitimacy")
-        if university_legitimacy == "verified":
-            verification_scores.append(1.0)
-        elif university_legitimacy == "assumed_legitimate":
-            verification_scores.append(0.9)  # High trust for assumed legitimate
-        else:
-            verification_scores.append(0.6)
-
-        # Company verification
         company_legitimacy = company_result.get("legitimacy")
-        if company_legitimacy == "verified":
-            verification_scores.append(1.0)
-        elif company_legitimacy == "assumed_legitimate":
-            verification_scores.append(0.9)  # High trust for assumed legitimate
-        else:
-            verification_scores.append(0.6)
-
-        # Address verification
         address_verified = address_result.get("valid", False)
-        if address_verified:
-            verification_scores.append(1.0)
-        else:
-            verification_scores.append(0.5)
 
-        # Average confidence
+        # Average confidence over the three checks
         avg_confidence = (
-            sum(verification_scores) / len(verification_scores)
-            if verification_scores
-            else 0.5
-        )
+            _LEGITIMACY_SCORES.get(university_legitimacy, _UNVERIFIED_LEGITIMACY_SCORE)
+            + _LEGITIMACY_SCORES.get(company_legitimacy, _UNVERIFIED_LEGITIMACY_SCORE)
+            + _ADDRESS_SCORES[bool(address_verified)]
+        ) / 3
 
         # Calculate risk score
         risk_score = int((1 - avg_confidence) * 100)
@@ -150,36 +170,10 @@ class VerificationAgent(AnalysisAgent):
         analysis = {
             "agent_name": self.name,
             "confidence_score": round(avg_confidence, 2),
-            "university_verification": {
-                "name": university_result.get("name"),
-                "country": university_result.get("country"),
-                "ranking": university_result.get("ranking"),
-                "accredited": university_result.get("accredited"),
-                "legitimacy": university_result.get("legitimacy"),
-            },
-            "company_verification": {
-                "name": company_result.get("name"),
-                "industry": company_result.get("industry"),
-                "employees": company_result.get("employees"),
-                "founded": company_result.get("founded"),
-                "legitimacy": company_result.get("legitimacy"),
-                "rating": company_result.get("rating"),
-            },
-            "address_verification": {
-                "address": address_result.get("address"),
-                "valid": address_result.get("valid"),
-                "geocoded": address_result.get("geocoded"),
-                "city": address_result.get("city"),
-                "state": address_result.get("state"),
-                "zip_code": address_result.get("zip_code"),
-            },
-            "salary_benchmark": {
-                "job_title": salary_benchmark.get("job_title"),
-                "location": salary_benchmark.get("location"),
-                "salary_range": salary_benchmark.get("salary_range"),
-                "data_points": salary_benchmark.get("data_points"),
-                "confidence": salary_benchmark.get("confidence"),
-            },
+            "university_verification": {f: university_result.get(f) for f in _UNIVERSITY_FIELDS},
+            "company_verification": {f: company_result.get(f) for f in _COMPANY_FIELDS},
+            "address_verification": {f: address_result.get(f) for f in _ADDRESS_FIELDS},
+            "salary_benchmark": {f: salary_benchmark.get(f) for f in _SALARY_BENCHMARK_FIELDS},
             "red_flags": red_flags,
             "recommendation": recommendation,
             "reasoning": self._generate_reasoning(
@@ -199,23 +193,18 @@ class VerificationAgent(AnalysisAgent):
         application: LoanApplication,
     ) -> List[str]:
         """Detect red flags from verification results."""
-        red_flags = []
-
-        # University red flags - only flag if explicitly unverified, not assumed_legitimate
-        university_legitimacy = university_result.get("legitimacy")
-        if university_legitimacy not in ["verified", "assumed_legitimate"]:
-            red_flags.append("University could not be verified")
-
-        # Company red flags - only flag if explicitly unverified, not assumed_legitimate
-        company_legitimacy = company_result.get("legitimacy")
-        if company_legitimacy not in ["verified", "assumed_legitimate"]:
-            red_flags.append("Company could not be verified")
-
-        # Address red flags
-        if not address_result.get("valid"):
-            red_flags.append("Address could not be verified")
+        results = {
+            "university": university_result,
+            "company": company_result,
+            "address": address_result,
+        }
+        red_flags = [
+            flag
+            for source, field, accepted, flag in _RED_FLAG_RULES
+            if results[source].get(field) not in accepted
+        ]
 
-        # Salary benchmark red flags
+        # Salary benchmark red flags compare against a range, so stay special-cased
         if (
             application.employment.monthly_salary
             and salary_benchmark.get("salary_range")
@@ -283,17 +272,4 @@ class VerificationAgent(AnalysisAgent):
 
     def get_system_prompt(self) -> str:
         """Get system prompt for this agent."""
-        return """You are a verification specialist with access to web search and external APIs.
-Your job is to verify customer-provided information using reliable external sources.
-
-Key responsibilities:
-1. Verify university reputation and accreditation
-2. Validate company existence and legitimacy
-3. Check employer reviews and financial health
-4. Verify address authenticity using geocoding
-5. Benchmark salary against market data
-6. Cross-reference identity information
-7. Gather market intelligence for assessment
-
-Use multiple sources and cite your references. Be thorough and objective.
-Clearly distinguish between verified, partially verified, and unverified information."""
+        return _VERIFICATION_SYSTEM_PROMPT
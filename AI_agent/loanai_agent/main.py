@@ -1,9 +1,12 @@
 """Main application orchestrator and entry point."""
 
 import asyncio
-from asyncio import TimeoutError
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -13,8 +16,10 @@ from loanai_agent.agents import (
     SalaryStatementAgent,
     VerificationAgent,
 )
+from loanai_agent.agents.base_agent import BaseAgent
 from loanai_agent.models import (
     DecisionResult,
+    DecisionStatus,
     DocumentInfo,
     DocumentType,
     LoanApplication,
@@ -33,11 +38,59 @@ from loanai_agent.utils import AgentException, generate_correlation_id, get_logg
 
 logger = get_logger(__name__)
 
+DELIBERATION_TOPIC = "Application Risk Assessment and Approval Recommendation"
+
+_ANALYSIS_KEYS = ("bank_analysis", "salary_analysis", "verification_analysis")
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(epoch_second: int) -> str:
+    """ISO-format a whole epoch second; consecutive calls share the result."""
+    return datetime.fromtimestamp(epoch_second).isoformat()
+
+
+def _timestamp() -> str:
+    """Current local time as an ISO string, to the second."""
+    return _format_timestamp(int(time.time()))
+
+
+# Conditions attached when the overall risk score exceeds each threshold
+_RISK_CONDITIONS = (
+    (60, ("Require income verification by third party", "Require collateral evaluation")),
+    (40, ("Require additional references",)),
+)
+
+# Stand-in for a missing analysis, shared instead of a fresh {} per lookup
+_NO_ANALYSIS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _analyses(analysis_results: Dict[str, Any]) -> Tuple[Mapping[str, Any], ...]:
+    """Sub-agent analyses in ``_ANALYSIS_KEYS`` order; missing or empty ones are empty."""
+    return tuple(analysis_results.get(name) or _NO_ANALYSIS for name in _ANALYSIS_KEYS)
+
+
+def _pluck(analyses: Tuple[Mapping[str, Any], ...], key: str, default: Any) -> list:
+    """Read one field from each analysis returned by ``_analyses``."""
+    return [analysis.get(key, default) for analysis in analyses]
+
 
 class LoanApplicationProcessor:
     """Main orchestrator for loan application processing."""
 
+    __slots__ = (
+        "loan_officer",
+        "bank_agent",
+        "salary_agent",
+        "verification_agent",
+        "comm_hub",
+        "logger",
+        "_agent_names",
+    )
+
     AGENT_TIMEOUT = 30  # seconds per agent
+    # Deliberation is skipped when all sub-agents recommend the same outcome
+    # and their risk scores are closer together than this
+    UNANIMOUS_RISK_SPREAD = 15
 
     def __init__(self):
         """Initialize the loan processor with all agents."""
@@ -57,6 +110,13 @@ class LoanApplicationProcessor:
         )
 
         self.logger = get_logger(__name__)
+        # Agent names never change, so status checks share one tuple
+        self._agent_names = (
+            self.loan_officer.name,
+            self.bank_agent.name,
+            self.salary_agent.name,
+            self.verification_agent.name,
+        )
 
     async def process(self, application: LoanApplication) -> DecisionResult:
         """Process a loan application through the multi-agent system.
@@ -69,130 +129,197 @@ class LoanApplicationProcessor:
         """
         correlation_id = generate_correlation_id()
         self.logger.info(
-            f"Starting loan application processing for {application.customer_id} "
-            f"(correlation_id={correlation_id})"
+            "Starting loan application processing for {} (correlation_id={})",
+            application.customer_id,
+            correlation_id,
         )
 
-        try:
-            # Phase 1: Parallel sub-agent analysis
-            self.logger.info("Phase 1: Launching parallel analysis")
-            analysis_results = await self._run_parallel_analysis(application)
-
-            # Phase 2: Inter-agent deliberation
-            self.logger.info("Phase 2: Starting inter-agent deliberation")
-            deliberation = await self._facilitate_deliberation(application, analysis_results)
-
-            # Phase 3: Consensus building
-            self.logger.info("Phase 3: Building consensus")
-            consensus = await self._build_consensus(analysis_results, deliberation)
-
-            # Phase 4: Final decision
-            self.logger.info("Phase 4: Making final decision")
-            final_decision = await self._make_final_decision(
-                application, analysis_results, consensus
-            )
+        # The application does not change while it is processed, so it is
+        # dumped once and shared by every phase; JSON mode keeps it
+        # embeddable in deliberation prompts (no datetime values)
+        application_data = application.model_dump(mode="json")
 
-            self.logger.info(
-                f"Application processing complete. Decision: {final_decision.decision}"
-            )
+        try:
+            # Every task below belongs to the group, so leaving it (normally
+            # or through an error) never leaves an analysis or LLM call behind
+            async with asyncio.TaskGroup() as group:
+                # Phase 1: Parallel sub-agent analysis
+                self.logger.info("Phase 1: Launching parallel analysis")
+                analysis_tasks = self._start_parallel_analysis(application, group)
+                deliberation_needed = group.create_task(
+                    self._deliberation_needed(analysis_tasks)
+                )
+                # Each agent's opening statement only needs its own analysis and
+                # the certainty that deliberation will run, so it can start
+                # before the slowest analysis lands
+                opening_responses = {
+                    agent.name: group.create_task(
+                        self._opening_contribution(
+                            application_data,
+                            name,
+                            agent,
+                            analysis_tasks[name],
+                            deliberation_needed,
+                        )
+                    )
+                    for name, agent in self._analysis_agents()
+                }
+
+                analysis_results = dict(
+                    zip(analysis_tasks, await asyncio.gather(*analysis_tasks.values()))
+                )
+
+                # Phase 2: Inter-agent deliberation
+                if not await deliberation_needed:
+                    self.logger.info("Phase 2: Skipping deliberation, sub-agents agree")
+                    deliberation = {"topic": DELIBERATION_TOPIC, "rounds": [], "skipped": True}
+                else:
+                    self.logger.info("Phase 2: Starting inter-agent deliberation")
+                    deliberation = await self._facilitate_deliberation(
+                        application, analysis_results, opening_responses, application_data
+                    )
+
+                # Phase 3: Consensus building
+                self.logger.info("Phase 3: Building consensus")
+                consensus = await self._build_consensus(analysis_results, deliberation)
+
+                # Phase 4: Final decision
+                self.logger.info("Phase 4: Making final decision")
+                final_decision = await self._make_final_decision(
+                    application, analysis_results, consensus, application_data
+                )
+
+        except BaseExceptionGroup as group_error:
+            # Analyses and opening statements turn their own failures into
+            # results, so the group only fails when a phase raises; re-raise
+            # that error rather than the group wrapping it
+            error = group_error.exceptions[0]
+            self.logger.error("Application processing failed: {}", error)
+            raise error from None
 
-            return final_decision
+        self.logger.info(
+            "Application processing complete. Decision: {}", final_decision.decision
+        )
 
-        except Exception as e:
-            self.logger.error(f"Application processing failed: {e}")
-            raise
+        return final_decision
 
-    async def _run_parallel_analysis(
-        self, application: LoanApplication
-    ) -> Dict[str, Union[BankStatementAnalysis, SalaryStatementAnalysis, VerificationAnalysis]]:
-        """Run parallel analysis from all sub-agents with proper error handling and timeouts.
+    async def process_batch(
+        self, applications: List[LoanApplication], max_concurrency: int = 16
+    ) -> List[Union[DecisionResult, Exception]]:
+        """Process several applications concurrently.
+        
+        At most ``max_concurrency`` applications are in flight at once, so
+        the agents' LLM calls overlap across the batch without exceeding
+        provider rate limits.
         
         Args:
-            application: Loan application to analyze
+            applications: Loan applications to process
+            max_concurrency: Maximum number of applications processed at once
             
         Returns:
-            Dictionary of analysis results with typed responses
+            Decisions in input order; a failed application is returned as its exception
         """
-        self.logger.info("Executing parallel analysis with timeouts")
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Create tasks with timeout wrappers
-        tasks = {
-            "bank_analysis": self._run_with_timeout(
-                self.bank_agent.analyze(application),
-                self.AGENT_TIMEOUT,
-                "BankStatementAgent",
-            ),
-            "salary_analysis": self._run_with_timeout(
-                self.salary_agent.analyze(application),
-                self.AGENT_TIMEOUT,
-                "SalaryStatementAgent",
-            ),
-            "verification_analysis": self._run_with_timeout(
-                self.verification_agent.analyze(application),
-                self.AGENT_TIMEOUT,
-                "VerificationAgent",
-            ),
-        }
+        async def process_one(application: LoanApplication) -> DecisionResult:
+            async with semaphore:
+                return await self.process(application)
 
-        # Run all tasks in parallel with gather (return_exceptions=True)
-        # This ensures one failure doesn't cancel other tasks
-        results_list = await asyncio.gather(
-            *tasks.values(),
-            return_exceptions=True
+        return await asyncio.gather(
+            *(process_one(application) for application in applications),
+            return_exceptions=True,
         )
 
-        # Map results back to names and handle exceptions
-        results = {}
-        for (name, _), result in zip(tasks.items(), results_list):
-            if isinstance(result, Exception):
-                self.logger.error(f"{name} failed with exception: {result}")
-                results[name] = self._create_error_analysis(name, result)
-            else:
-                results[name] = result
-                self.logger.info(f"{name} completed successfully")
-
-        # Convert Pydantic models to dicts for compatibility
-        results_dict = {}
-        for name, result in results.items():
-            if hasattr(result, 'dict'):
-                # It's a Pydantic model
-                results_dict[name] = result.dict()
-            elif hasattr(result, 'model_dump'):
-                # Pydantic v2
-                results_dict[name] = result.model_dump()
-            else:
-                # Already a dict
-                results_dict[name] = result
+    def _analysis_agents(self):
+        """Pairs of analysis result key and the sub-agent producing it."""
+        return (
+            ("bank_analysis", self.bank_agent),
+            ("salary_analysis", self.salary_agent),
+            ("verification_analysis", self.verification_agent),
+        )
 
-        return results_dict
+    def _start_parallel_analysis(
+        self, application: LoanApplication, group: asyncio.TaskGroup
+    ) -> Dict[str, "asyncio.Task[Dict[str, Any]]"]:
+        """Start analysis from all sub-agents as concurrent tasks.
+        
+        Args:
+            application: Loan application to analyze
+            group: Task group owning the analysis tasks
+            
+        Returns:
+            Tasks resolving to each agent's analysis dict, keyed by result name
+        """
+        self.logger.info("Executing parallel analysis with timeouts")
 
-    async def _run_with_timeout(
-        self, 
-        coro, 
-        timeout: float, 
-        agent_name: str
-    ) -> Union[BaseModel, Exception]:
-        """Run coroutine with timeout.
+        return {
+            name: group.create_task(
+                self._run_analysis(name, agent.__class__.__name__, agent.analyze(application))
+            )
+            for name, agent in self._analysis_agents()
+        }
+
+    async def _run_analysis(self, name: str, agent_name: str, coro) -> Dict[str, Any]:
+        """Run one sub-agent analysis, substituting an error analysis on failure.
         
         Args:
-            coro: Coroutine to run
-            timeout: Timeout in seconds
+            name: Analysis result key
             agent_name: Name of the agent for logging
+            coro: Agent analysis coroutine
             
         Returns:
-            Result from coroutine or raises exception
-            
-        Raises:
-            AgentException: If timeout or other error occurs
+            Analysis result as a dict
         """
+        deadline = asyncio.timeout(self.AGENT_TIMEOUT)
         try:
-            return await asyncio.wait_for(coro, timeout=timeout)
-        except TimeoutError:
-            self.logger.error(f"{agent_name} timed out after {timeout}s")
-            raise AgentException(f"{agent_name} timed out after {timeout}s")
+            async with deadline:
+                result = await coro
         except Exception as e:
-            self.logger.error(f"{agent_name} failed: {e}", exc_info=True)
-            raise
+            # One failure must not cancel or fail the other analyses, so the
+            # error becomes the analysis result instead of propagating
+            error = e
+            if deadline.expired():
+                error = AgentException(f"{agent_name} timed out after {self.AGENT_TIMEOUT}s")
+                self.logger.error("{}", error)
+            else:
+                self.logger.opt(exception=True).error("{} failed: {}", agent_name, e)
+            result = self._create_error_analysis(name, error)
+        else:
+            self.logger.info("{} completed successfully", name)
+
+        # Downstream consumers expect dicts. Dump once, via model_dump rather
+        # than the deprecated dict() shim, which warns on every call
+        return result.model_dump() if isinstance(result, BaseModel) else result
+
+    async def _opening_contribution(
+        self,
+        application_data: Dict[str, Any],
+        name: str,
+        agent: BaseAgent,
+        analysis_task: "asyncio.Task[Dict[str, Any]]",
+        deliberation_needed: "asyncio.Task[bool]",
+    ) -> Optional[str]:
+        """Get a sub-agent's opening deliberation statement once its analysis is done.
+        
+        Args:
+            application_data: JSON-mode dump of the original application
+            name: Analysis result key
+            agent: Sub-agent that produced the analysis
+            analysis_task: Task producing the agent's analysis
+            deliberation_needed: Task deciding whether deliberation runs
+            
+        Returns:
+            Agent's first-round contribution, or None if deliberation is skipped
+        """
+        result = await asyncio.shield(analysis_task)
+        # No LLM call is made for a statement deliberation would not use
+        if not await asyncio.shield(deliberation_needed):
+            return None
+        return await self.comm_hub.contribute(
+            agent.name,
+            DELIBERATION_TOPIC,
+            {"application": application_data, "analysis_results": {name: result}},
+        )
 
     def _create_error_analysis(
         self, 
@@ -225,16 +352,67 @@ class LoanApplicationProcessor:
         else:
             return VerificationAnalysis(**error_data)
 
+    async def _deliberation_needed(
+        self, analysis_tasks: Dict[str, "asyncio.Task[Dict[str, Any]]"]
+    ) -> bool:
+        """Decide whether deliberation runs, as soon as the analyses allow.
+        
+        More analyses can only break agreement, so deliberation is certain
+        once the finished ones disagree; otherwise all of them must finish.
+        
+        Args:
+            analysis_tasks: Tasks producing each agent's analysis, by result name
+            
+        Returns:
+            True unless the sub-agents agree
+        """
+        pending = set(analysis_tasks.values())
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            finished = tuple(
+                task.result() or _NO_ANALYSIS for task in analysis_tasks.values() if task.done()
+            )
+            if pending and not self._unanimous(finished):
+                return True
+        return not self._analyses_agree(
+            {name: task.result() for name, task in analysis_tasks.items()}
+        )
+
+    def _analyses_agree(self, analysis_results: Dict[str, Any]) -> bool:
+        """Check whether deliberation could change the sub-agents' outcome.
+        
+        Args:
+            analysis_results: Analysis results from all agents
+            
+        Returns:
+            True if all recommendations match and risk scores cluster tightly
+        """
+        return self._unanimous(_analyses(analysis_results))
+
+    def _unanimous(self, analyses: Tuple[Mapping[str, Any], ...]) -> bool:
+        """Whether ``analyses`` share a recommendation and closely clustered risk scores."""
+        recommendations = _pluck(analyses, "recommendation", None)
+        risks = _pluck(analyses, "risk_score", 50)
+        return (
+            recommendations[0] is not None
+            and recommendations.count(recommendations[0]) == len(recommendations)
+            and max(risks) - min(risks) < self.UNANIMOUS_RISK_SPREAD
+        )
+
     async def _facilitate_deliberation(
         self,
         application: LoanApplication,
         analysis_results: Dict[str, Any],
+        opening_responses: Optional[Dict[str, Awaitable[str]]] = None,
+        application_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Facilitate inter-agent deliberation.
         
         Args:
             application: Original application
             analysis_results: Analysis results from all agents
+            opening_responses: Opening statements already under way, by agent name
+            application_data: JSON-mode dump of the application, if already available
             
         Returns:
             Deliberation transcript
@@ -249,12 +427,14 @@ class LoanApplicationProcessor:
 
         deliberation = await self.comm_hub.facilitate_discussion(
             participants=participants,
-            topic="Application Risk Assessment and Approval Recommendation",
+            topic=DELIBERATION_TOPIC,
             context={
-                "application": application.dict(),
+                "application": application_data or application.model_dump(mode="json"),
                 "analysis_results": analysis_results,
             },
-            max_rounds=2,
+            max_rounds=self.loan_officer.max_consensus_rounds,
+            agreement_threshold=self.loan_officer.consensus_threshold,
+            opening_responses=opening_responses,
         )
 
         return deliberation
@@ -280,9 +460,7 @@ class LoanApplicationProcessor:
             deliberation_transcript=deliberation,
         )
 
-        self.logger.info(
-            f"Consensus reached: {consensus.get('overall_recommendation')}"
-        )
+        self.logger.info("Consensus reached: {}", consensus.get("overall_recommendation"))
 
         return consensus
 
@@ -291,6 +469,7 @@ class LoanApplicationProcessor:
         application: LoanApplication,
         analysis_results: Dict[str, Any],
         consensus: Dict[str, Any],
+        application_data: Optional[Dict[str, Any]] = None,
     ) -> DecisionResult:
         """Make final decision by Loan Officer.
         
@@ -298,6 +477,7 @@ class LoanApplicationProcessor:
             application: Original application
             analysis_results: Analysis results
             consensus: Consensus result
+            application_data: JSON-mode dump of the application, if already available
             
         Returns:
             Final decision result
@@ -305,12 +485,15 @@ class LoanApplicationProcessor:
         self.logger.info("Making final decision")
 
         # Extract risk scores
-        bank_risk = analysis_results.get("bank_analysis", {}).get("risk_score", 50)
-        salary_risk = analysis_results.get("salary_analysis", {}).get("risk_score", 50)
-        verification_risk = analysis_results.get("verification_analysis", {}).get("risk_score", 50)
+        analyses = _analyses(analysis_results)
+        bank_risk, salary_risk, verification_risk = _pluck(analyses, "risk_score", 50)
 
         # Calculate aggregate risk
-        loan_details = application.loan_request.dict()
+        loan_details = (
+            application_data["loan_request"]
+            if application_data
+            else application.loan_request.model_dump()
+        )
         risk_assessment = RiskScoringEngine.calculate_aggregate_risk(
             bank_risk, salary_risk, verification_risk, loan_details
         )
@@ -318,25 +501,10 @@ class LoanApplicationProcessor:
         overall_risk = risk_assessment["total_risk_score"]
 
         # Extract confidence scores
-        bank_conf = analysis_results.get("bank_analysis", {}).get("confidence_score", 0.5)
-        salary_conf = analysis_results.get("salary_analysis", {}).get("confidence_score", 0.5)
-        verification_conf = analysis_results.get("verification_analysis", {}).get(
-            "confidence_score", 0.5
-        )
-
-        overall_confidence = (bank_conf + salary_conf + verification_conf) / 3
+        overall_confidence = sum(_pluck(analyses, "confidence_score", 0.5)) / 3
 
         # Collect red flags
-        red_flags = []
-        red_flags.extend(
-            analysis_results.get("bank_analysis", {}).get("red_flags", [])
-        )
-        red_flags.extend(
-            analysis_results.get("salary_analysis", {}).get("red_flags", [])
-        )
-        red_flags.extend(
-            analysis_results.get("verification_analysis", {}).get("red_flags", [])
-        )
+        red_flags = list(chain.from_iterable(_pluck(analyses, "red_flags", ())))
 
         # Make decision
         consensus_rec = consensus.get("overall_recommendation", "manual_review")
@@ -349,7 +517,7 @@ class LoanApplicationProcessor:
 
         # Calculate loan terms if approved
         loan_terms = None
-        if decision.value == "APPROVED":
+        if decision is DecisionStatus.APPROVED:
             loan_terms = DecisionEngine.calculate_loan_terms(
                 decision,
                 application.loan_request.loan_amount,
@@ -357,22 +525,23 @@ class LoanApplicationProcessor:
                 overall_risk,
             )
 
-        # Generate detailed report
+        # Generate detailed report; one clock read stamps both the report and
+        # the result, so the two timestamps always agree. The sub-agent
+        # analyses are not repeated here: they are already attached to the
+        # result as bank_analysis, salary_analysis and verification_analysis.
+        decided_at = time.time()
         detailed_report = {
             "risk_assessment": risk_assessment,
-            "analysis_results": analysis_results,
             "consensus": consensus,
             "red_flags": red_flags,
-            "processing_timestamp": datetime.now().isoformat(),
+            "processing_timestamp": _format_timestamp(int(decided_at)),
         }
 
         # Generate explanation
         explanation = DecisionEngine.generate_explanation(
             decision,
             overall_risk,
-            analysis_results.get("bank_analysis", {}).get("reasoning", "N/A"),
-            analysis_results.get("salary_analysis", {}).get("reasoning", "N/A"),
-            analysis_results.get("verification_analysis", {}).get("reasoning", "N/A"),
+            *_pluck(analyses, "reasoning", "N/A"),
         )
 
         # Create final decision result
@@ -390,6 +559,7 @@ class LoanApplicationProcessor:
             salary_analysis=analysis_results.get("salary_analysis"),
             verification_analysis=analysis_results.get("verification_analysis"),
             consensus=consensus,
+            decision_timestamp=datetime.fromtimestamp(decided_at),
         )
 
         return final_decision
@@ -404,14 +574,12 @@ class LoanApplicationProcessor:
         Returns:
             List of loan conditions
         """
-        conditions = []
-
-        if risk_score > 60:
-            conditions.append("Require income verification by third party")
-            conditions.append("Require collateral evaluation")
-
-        if risk_score > 40:
-            conditions.append("Require additional references")
+        conditions = [
+            condition
+            for threshold, risk_conditions in _RISK_CONDITIONS
+            if risk_score > threshold
+            for condition in risk_conditions
+        ]
 
         if red_flags:
             if len(red_flags) > 2:
@@ -429,11 +597,19 @@ class LoanApplicationProcessor:
         """
         return {
             "status": "ready",
-            "agents": [
-                self.loan_officer.name,
-                self.bank_agent.name,
-                self.salary_agent.name,
-                self.verification_agent.name,
-            ],
-            "timestamp": datetime.now().isoformat(),
+            "agents": self._agent_names,
+            "timestamp": _timestamp(),
         }
+
+
+@lru_cache(maxsize=1)
+def get_processor() -> LoanApplicationProcessor:
+    """Get the process-wide loan processor.
+
+    Agents and the communication hub are built once and reused, so a
+    long-running process does not pay their setup cost per application.
+
+    Returns:
+        Shared loan processor
+    """
+    return LoanApplicationProcessor()
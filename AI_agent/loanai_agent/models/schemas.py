@@ -1,10 +1,26 @@
 """Data models and schemas for loan application processing."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+MIN_BIRTH_YEAR = 1900
+MIN_APPLICANT_AGE = 18
+
+
+@lru_cache(maxsize=1)
+def _latest_birth_year(day: int) -> int:
+    """Latest allowed birth year on ``day``, counted in days since the epoch (UTC).
+    
+    The year is derived from the key itself, so the cached value changes
+    exactly when the UTC date does, whatever the host's timezone.
+    """
+    return datetime.fromtimestamp(day * 86400, timezone.utc).year - MIN_APPLICANT_AGE
 
 
 # ==================== Enum Types ====================
@@ -59,6 +75,9 @@ class DocumentType(str, Enum):
 class PersonalInfo(BaseModel):
     """Customer personal information."""
 
+    # Frozen so the cached full_name_lower cannot go stale
+    model_config = ConfigDict(frozen=True)
+
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     personal_id: str = Field(..., min_length=1, max_length=50)
@@ -71,15 +90,18 @@ class PersonalInfo(BaseModel):
     @classmethod
     def validate_birth_year(cls, v: str) -> str:
         """Validate birth year is numeric and reasonable."""
-        try:
-            year = int(v)
-            current_year = datetime.now().year
-            if year < 1900 or year > current_year - 18:
-                raise ValueError("Invalid birth year")
-        except ValueError:
+        if len(v) != 4 or not v.isdecimal():
             raise ValueError("Birth year must be a valid 4-digit number")
+        year = int(v)
+        if year < MIN_BIRTH_YEAR or year > _latest_birth_year(int(time.time() // 86400)):
+            raise ValueError("Invalid birth year")
         return v
 
+    @cached_property
+    def full_name_lower(self) -> str:
+        """Lower-cased "first last" name, for matching against documents."""
+        return f"{self.first_name} {self.last_name}".lower()
+
 
 # ==================== Education ====================
 
@@ -154,22 +176,31 @@ class LoanApplication(BaseModel):
     education: Education
     employment: Employment
     loan_request: LoanRequest
-    documents: List[DocumentInfo] = Field(default_factory=list)
+    # A tuple, and a frozen model, so the cached documents_by_type cannot go stale
+    documents: Tuple[DocumentInfo, ...] = ()
     created_at: datetime = Field(default_factory=datetime.now)
     application_status: str = Field(default="pending")
 
-    class Config:
-        """Model configuration."""
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
-        use_enum_values = True
+    @cached_property
+    def documents_by_type(self) -> Dict[DocumentType, DocumentInfo]:
+        """Index documents by type, keeping the first of each type."""
+        index: Dict[DocumentType, DocumentInfo] = {}
+        for document in self.documents:
+            index.setdefault(document.document_type, document)
+        return index
 
 
 # ==================== Agent Analysis Results ====================
+# Results are built once by their agent and then only read, so they are frozen
 
 
 class BankStatementAnalysis(BaseModel):
     """Bank statement analysis result."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str = "bank_statement_agent"
     confidence_score: float = Field(default=0.0, ge=0, le=1)
     document_authenticity: str = "unknown"  # "verified", "suspicious", "rejected", "unknown"
@@ -190,6 +221,8 @@ class BankStatementAnalysis(BaseModel):
 class SalaryStatementAnalysis(BaseModel):
     """Salary statement analysis result."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str = "salary_statement_agent"
     confidence_score: float = Field(default=0.0, ge=0, le=1)
     document_authenticity: str = "unknown"  # "verified", "suspicious", "rejected", "unknown"
@@ -214,6 +247,8 @@ class SalaryStatementAnalysis(BaseModel):
 class VerificationAnalysis(BaseModel):
     """External verification analysis result."""
 
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str = "verification_agent"
     confidence_score: float = Field(default=0.0, ge=0, le=1)
     university_verification: dict = Field(default_factory=dict)
@@ -229,12 +264,16 @@ class VerificationAnalysis(BaseModel):
 class ConsensusResult(BaseModel):
     """Consensus between agents."""
 
+    model_config = ConfigDict(frozen=True)
+
     overall_recommendation: str  # "approve", "reject", "manual_review"
     confidence_score: float = Field(..., ge=0, le=1)
     risk_score: int = Field(..., ge=0, le=100)
     agent_agreements: dict = Field(default_factory=dict)
     disagreement_details: Optional[str] = None
     discussion_summary: str = ""
+    agreement: float = Field(default=0.0, ge=0, le=1)
+    rounds_used: int = 0
 
 
 # ==================== Final Decision ====================
@@ -259,7 +298,4 @@ class DecisionResult(BaseModel):
     decision_timestamp: datetime = Field(default_factory=datetime.now)
     decision_officer: str = "loan_officer_agent"
 
-    class Config:
-        """Model configuration."""
-
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
@@ -1,5 +1,9 @@
 """Protocols package initialization."""
 
+from loanai_agent.protocols.calibration import (
+    DecisionThresholds,
+    ThresholdCalibrator,
+)
 from loanai_agent.protocols.communication import (
     AgentCommunicationHub,
     AgentMessage,
@@ -28,4 +32,6 @@ __all__ = [
     "ConservativeDecisionStrategy",
     "AggressiveDecisionStrategy",
     "BalancedDecisionStrategy",
+    "DecisionThresholds",
+    "ThresholdCalibrator",
 ]
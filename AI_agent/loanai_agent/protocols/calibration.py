@@ -0,0 +1,136 @@
+"""Offline calibration of loan officer decision thresholds."""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence, Tuple, Union
+
+from loanai_agent.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class DecisionThresholds:
+    """Cut-offs used by the loan officer to turn scores into decisions.
+
+    Applications with a risk score below ``approve_below`` are approved,
+    those at or above ``reject_from`` are rejected, and the rest go to manual
+    review. Approvals with confidence under ``confidence_cutoff`` are sent to
+    manual review instead.
+    """
+
+    approve_below: int = 40
+    reject_from: int = 60
+    confidence_cutoff: float = 0.6
+
+    @property
+    def risk_thresholds(self) -> Tuple[int, int]:
+        """Sorted risk cut-offs for ``bisect_right`` lookups."""
+        return (self.approve_below, self.reject_from)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write thresholds to a JSON file.
+
+        Args:
+            path: Destination file
+        """
+        Path(path).write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DecisionThresholds":
+        """Read thresholds from a JSON file written by ``save``.
+
+        Args:
+            path: Source file
+
+        Returns:
+            Loaded thresholds
+        """
+        return cls(**json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class ThresholdCalibrator:
+    """Fit decision thresholds on historical loan outcomes.
+
+    Runs a grid search over integer risk cut-offs and confidence cut-offs in
+    steps of ``confidence_step``, choosing the values that maximize F1 on
+    closed loans. Meant to be run offline (for example nightly) and the
+    result saved with ``DecisionThresholds.save``.
+    """
+
+    def __init__(self, confidence_step: float = 0.05):
+        """Initialize calibrator.
+
+        Args:
+            confidence_step: Spacing of the confidence cut-off grid
+        """
+        steps = round(1 / confidence_step)
+        self.confidence_grid = [round(i * confidence_step, 4) for i in range(steps + 1)]
+
+    def fit(
+        self,
+        risk_scores: Sequence[int],
+        confidences: Sequence[float],
+        outcomes: Sequence[bool],
+    ) -> DecisionThresholds:
+        """Calibrate thresholds.
+
+        The approval cut-offs maximize F1 of "approved" against loans that
+        were repaid; the rejection cut-off maximizes F1 of "rejected" against
+        loans that defaulted and is never below the approval cut-off. When
+        no candidate beats the defaults, the defaults are kept.
+
+        Args:
+            risk_scores: Overall risk score per closed loan (0-100)
+            confidences: Overall confidence per closed loan (0-1)
+            outcomes: True if the loan was repaid, False if it defaulted
+
+        Returns:
+            Calibrated thresholds
+
+        Raises:
+            ValueError: If the inputs are empty or of different lengths
+        """
+        if not risk_scores or not len(risk_scores) == len(confidences) == len(outcomes):
+            raise ValueError("risk_scores, confidences and outcomes must be non-empty and equal length")
+
+        default = DecisionThresholds()
+        samples = list(zip(risk_scores, confidences, outcomes))
+
+        best_approve = (default.approve_below, default.confidence_cutoff)
+        best_f1 = self._f1(
+            samples, lambda r, c: r < default.approve_below and c >= default.confidence_cutoff, True
+        )
+        for cutoff in self.confidence_grid:
+            for approve_below in range(101):
+                f1 = self._f1(samples, lambda r, c: r < approve_below and c >= cutoff, True)
+                if f1 > best_f1:
+                    best_f1, best_approve = f1, (approve_below, cutoff)
+
+        approve_below, confidence_cutoff = best_approve
+        reject_from = max(default.reject_from, approve_below)
+        best_f1 = self._f1(samples, lambda r, c: r >= reject_from, False)
+        for candidate in range(approve_below, 101):
+            f1 = self._f1(samples, lambda r, c: r >= candidate, False)
+            if f1 > best_f1:
+                best_f1, reject_from = f1, candidate
+
+        thresholds = DecisionThresholds(approve_below, reject_from, confidence_cutoff)
+        logger.info(f"Calibrated decision thresholds on {len(samples)} loans: {thresholds}")
+        return thresholds
+
+    @staticmethod
+    def _f1(samples, predict, positive: bool) -> float:
+        """F1 score of ``predict`` against outcomes equal to ``positive``."""
+        tp = fp = fn = 0
+        for risk, confidence, outcome in samples:
+            predicted = predict(risk, confidence)
+            actual = bool(outcome) == positive
+            if predicted and actual:
+                tp += 1
+            elif predicted:
+                fp += 1
+            elif actual:
+                fn += 1
+        return 2 * tp / (2 * tp + fp + fn) if tp else 0.0
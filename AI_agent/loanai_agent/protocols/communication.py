@@ -1,10 +1,12 @@
 """Agent communication and coordination protocol."""
 
-import json
+import asyncio
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional
 
 import google.generativeai as genai
+import orjson
 
 from config.settings import settings
 from loanai_agent.agents.base_agent import BaseAgent
@@ -13,6 +15,11 @@ from loanai_agent.utils import CommunicationException, get_logger
 logger = get_logger(__name__)
 
 
+def _prompt_json(obj: Any) -> str:
+    """Render ``obj`` as indented JSON for an LLM prompt."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
 class AgentMessage:
     """Represents a message between agents."""
 
@@ -39,30 +46,45 @@ class AgentMessage:
         self.payload = payload
         self.timestamp = datetime.now().isoformat()
         self.correlation_id = correlation_id
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "from_agent": self.from_agent,
-            "to_agent": self.to_agent,
-            "message_type": self.message_type,
-            "payload": self.payload,
+        # Messages are not modified after creation, so the dict form is
+        # built once and shared by the transcript and the history
+        self._dict = {
+            "from_agent": from_agent,
+            "to_agent": to_agent,
+            "message_type": message_type,
+            "payload": payload,
             "timestamp": self.timestamp,
-            "correlation_id": self.correlation_id,
+            "correlation_id": correlation_id,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary.
+        
+        Returns the same dict on every call; treat it as read-only.
+        """
+        return self._dict
+
 
 class AgentCommunicationHub:
     """Central hub for agent communication and coordination."""
 
-    def __init__(self, agents: List[BaseAgent]):
+    def __init__(self, agents: List[BaseAgent], max_history: int = 1000):
         """Initialize communication hub with LLM-powered discussion capability.
         
         Args:
             agents: List of agents to coordinate
+            max_history: Number of most recent messages kept in the history
+            
+        Raises:
+            ValueError: If ``max_history`` is not positive
         """
+        if max_history <= 0:
+            raise ValueError("max_history must be positive")
         self.agents = {agent.name: agent for agent in agents}
-        self.message_history: List[AgentMessage] = []
+        # The hub lives as long as the processor, so only recent messages
+        # are kept; _by_correlation indexes exactly the retained ones
+        self.message_history: "deque[AgentMessage]" = deque(maxlen=max_history)
+        self._by_correlation: Dict[str, "deque[AgentMessage]"] = {}
         self.logger = get_logger(__name__)
         
         # Initialize LLM for facilitation
@@ -82,6 +104,8 @@ class AgentCommunicationHub:
         topic: str,
         context: Dict[str, Any],
         max_rounds: int = 3,
+        agreement_threshold: Optional[float] = None,
+        opening_responses: Optional[Dict[str, Awaitable[str]]] = None,
     ) -> Dict[str, Any]:
         """Facilitate multi-agent discussion.
         
@@ -90,16 +114,23 @@ class AgentCommunicationHub:
             topic: Discussion topic
             context: Context for discussion
             max_rounds: Maximum discussion rounds
+            agreement_threshold: End after the first round when at least this
+                fraction of the analyses in ``context["analysis_results"]``
+                already share a recommendation
+            opening_responses: First-round contributions already started
+                with ``contribute``, keyed by agent name
             
         Returns:
             Discussion result
         """
-        self.logger.info(f"Starting discussion on: {topic}")
+        self.logger.info("Starting discussion on: {}", topic)
 
+        agreement = self._agreement(context.get("analysis_results", {}))
         discussion_log = {
             "topic": topic,
             "participants": participants,
             "rounds": [],
+            "agreement": agreement,
             "started_at": datetime.now().isoformat(),
         }
 
@@ -109,16 +140,29 @@ class AgentCommunicationHub:
                 "messages": [],
             }
 
+            speakers = []
+            pending = []
             for agent_name in participants:
                 if agent_name not in self.agents:
-                    self.logger.warning(f"Agent {agent_name} not found")
+                    self.logger.warning("Agent {} not found", agent_name)
                     continue
 
                 # Simulate agent response
-                response = await self._get_agent_input(
-                    agent_name, topic, context, discussion_log.get("rounds", [])
-                )
-
+                speakers.append(agent_name)
+                if round_num == 0 and opening_responses and agent_name in opening_responses:
+                    pending.append(opening_responses[agent_name])
+                else:
+                    pending.append(
+                        self._get_agent_input(
+                            agent_name, topic, context, discussion_log.get("rounds", [])
+                        )
+                    )
+
+            # Contributions within a round only see earlier rounds, so the
+            # agents' LLM calls can run concurrently
+            responses = await asyncio.gather(*pending)
+
+            for agent_name, response in zip(speakers, responses):
                 message = AgentMessage(
                     from_agent=agent_name,
                     to_agent="all",
@@ -132,6 +176,15 @@ class AgentCommunicationHub:
 
             discussion_log["rounds"].append(round_result)
 
+            # Agents that already agree will not be moved by more rounds
+            if agreement_threshold is not None and agreement >= agreement_threshold:
+                self.logger.info(
+                    "Agent agreement {:.2f} meets threshold {:.2f} - ending discussion",
+                    agreement,
+                    agreement_threshold,
+                )
+                break
+
             # Check for early consensus
             if self._check_consensus(discussion_log):
                 self.logger.info("Early consensus reached")
@@ -140,6 +193,23 @@ class AgentCommunicationHub:
         discussion_log["ended_at"] = datetime.now().isoformat()
         return discussion_log
 
+    async def contribute(self, agent_name: str, topic: str, context: Dict[str, Any]) -> str:
+        """Get an agent's first-round contribution ahead of a discussion.
+
+        The first round only sees the agent's own analysis, so it can be
+        requested as soon as that analysis is available and handed to
+        ``facilitate_discussion`` via ``opening_responses``.
+        
+        Args:
+            agent_name: Name of agent
+            topic: Discussion topic
+            context: Context including the agent's analysis result
+            
+        Returns:
+            Agent's response
+        """
+        return await self._get_agent_input(agent_name, topic, context, [])
+
     async def build_consensus(
         self,
         analysis_results: Dict[str, Any],
@@ -212,10 +282,23 @@ class AgentCommunicationHub:
                 else None
             ),
             "discussion_summary": self._summarize_discussion(deliberation_transcript),
+            "agreement": self._agreement(analysis_results),
+            "rounds_used": len(deliberation_transcript.get("rounds", [])),
         }
 
         return consensus_result
 
+    @staticmethod
+    def _agreement(analysis_results: Dict[str, Any]) -> float:
+        """Fraction of analyses backing the most common recommendation."""
+        votes = Counter(
+            result.get("recommendation", "review")
+            for result in analysis_results.values()
+            if isinstance(result, dict)
+        )
+        total = sum(votes.values())
+        return round(max(votes.values()) / total, 2) if total else 0.0
+
     async def _get_agent_input(
         self,
         agent_name: str,
@@ -252,10 +335,10 @@ class AgentCommunicationHub:
 Discussion Topic: {topic}
 
 Your Analysis Results:
-{json.dumps(agent_context, indent=2)}
+{_prompt_json(agent_context)}
 
 Previous Discussion Rounds:
-{json.dumps(previous_rounds[-2:] if len(previous_rounds) > 2 else previous_rounds, indent=2)}
+{_prompt_json(previous_rounds[-2:])}
 
 Based on your expertise and analysis, provide your professional opinion on this loan application.
 Be specific, cite evidence from your analysis, and make a clear recommendation.
@@ -265,7 +348,7 @@ Keep your response concise (2-3 paragraphs)."""
             return response.text
             
         except Exception as e:
-            self.logger.error(f"Failed to generate LLM contribution for {agent_name}: {e}")
+            self.logger.error("Failed to generate LLM contribution for {}: {}", agent_name, e)
             return self._get_fallback_response(agent_name, context)
     
     def _build_agent_context(self, agent_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -335,7 +418,7 @@ Keep your response concise (2-3 paragraphs)."""
             prompt = f"""Analyze this multi-agent discussion and determine if the agents have reached consensus.
 
 Discussion:
-{json.dumps(discussion_log["rounds"][-2:], indent=2)}
+{_prompt_json(discussion_log["rounds"][-2:])}
 
 Consider:
 1. Are agents making consistent recommendations?
@@ -350,12 +433,12 @@ Answer with YES or NO, followed by a brief (1 sentence) explanation."""
             
             is_converged = result_text.startswith("YES")
             if is_converged:
-                self.logger.info(f"Consensus detected: {response.text}")
+                self.logger.info("Consensus detected: {}", response.text)
             
             return is_converged
             
         except Exception as e:
-            self.logger.error(f"Convergence check failed: {e}")
+            self.logger.error("Convergence check failed: {}", e)
             return False
 
     def _is_unanimous(self, recommendations: Dict[str, str]) -> bool:
@@ -392,10 +475,22 @@ Answer with YES or NO, followed by a brief (1 sentence) explanation."""
 
     def _log_message(self, message: AgentMessage) -> None:
         """Log a message."""
-        self.message_history.append(message)
+        history = self.message_history
+        if len(history) == history.maxlen:
+            # The oldest message is about to be dropped; it is also the
+            # oldest in its correlation group
+            evicted = history[0]
+            group = self._by_correlation[evicted.correlation_id]
+            group.popleft()
+            if not group:
+                del self._by_correlation[evicted.correlation_id]
+        history.append(message)
+        self._by_correlation.setdefault(message.correlation_id, deque()).append(message)
         self.logger.debug(
-            f"Message from {message.from_agent} to {message.to_agent}: "
-            f"{message.message_type}"
+            "Message from {} to {}: {}",
+            message.from_agent,
+            message.to_agent,
+            message.message_type,
         )
 
     def get_message_history(
@@ -410,9 +505,5 @@ Answer with YES or NO, followed by a brief (1 sentence) explanation."""
             List of messages
         """
         if correlation_id:
-            return [
-                m.to_dict()
-                for m in self.message_history
-                if m.correlation_id == correlation_id
-            ]
+            return [m.to_dict() for m in self._by_correlation.get(correlation_id, ())]
         return [m.to_dict() for m in self.message_history]
@@ -1,5 +1,6 @@
 """Decision framework and risk scoring."""
 
+from bisect import bisect_left
 from typing import Any, Dict, Optional
 
 from loanai_agent.models import DecisionResult, DecisionStatus
@@ -19,12 +20,36 @@ class RiskScoringEngine:
         "moderate_high": (61, 75),
         "high": (76, 100),
     }
+    # Upper bound and name of each level, sorted for bisect lookups
+    _RISK_LEVEL_BOUNDS = tuple(high for _, high in RISK_THRESHOLDS.values())
+    _RISK_LEVELS = tuple(RISK_THRESHOLDS)
 
     # Decision thresholds
     DECISION_THRESHOLD_APPROVE = 40
     DECISION_THRESHOLD_REVIEW = 60
     DECISION_THRESHOLD_REJECT = 75
 
+    # Weights of each agent's risk in the aggregate
+    AGENT_WEIGHTS = {
+        "bank": 0.4,
+        "salary": 0.35,
+        "verification": 0.25,
+    }
+
+    # Risk added per loan purpose; unknown purposes count as "others"
+    PURPOSE_RISK = {
+        "mortgage": 5,
+        "vehicle": 10,
+        "personal": 15,
+        "education": 8,
+        "business": 20,
+        "others": 15,
+    }
+
+    # Risk added for loans above each amount
+    LOAN_AMOUNT_TIERS = (100_000, 250_000, 500_000)
+    LOAN_AMOUNT_RISK = (0, 5, 10, 15)
+
     @staticmethod
     def calculate_aggregate_risk(
         bank_risk: int,
@@ -44,12 +69,7 @@ class RiskScoringEngine:
             Risk assessment result
         """
         # Weighted average of agent risks
-        agent_weights = {
-            "bank": 0.4,
-            "salary": 0.35,
-            "verification": 0.25,
-        }
-
+        agent_weights = RiskScoringEngine.AGENT_WEIGHTS
         total_risk = (
             (bank_risk * agent_weights["bank"])
             + (salary_risk * agent_weights["salary"])
@@ -84,16 +104,13 @@ class RiskScoringEngine:
         Returns:
             Risk adjustment value
         """
-        risk_adjustment = 0.0
-
         # Risk based on loan amount
         loan_amount = loan_details.get("loan_amount", 0)
-        if loan_amount > 500_000:
-            risk_adjustment += 15
-        elif loan_amount > 250_000:
-            risk_adjustment += 10
-        elif loan_amount > 100_000:
-            risk_adjustment += 5
+        risk_adjustment = float(
+            RiskScoringEngine.LOAN_AMOUNT_RISK[
+                bisect_left(RiskScoringEngine.LOAN_AMOUNT_TIERS, loan_amount)
+            ]
+        )
 
         # Risk based on loan duration
         loan_duration = loan_details.get("loan_duration", 24)
@@ -104,15 +121,7 @@ class RiskScoringEngine:
 
         # Risk based on loan purpose
         loan_purpose = loan_details.get("loan_purpose", "personal")
-        purpose_risk = {
-            "mortgage": 5,
-            "vehicle": 10,
-            "personal": 15,
-            "education": 8,
-            "business": 20,
-            "others": 15,
-        }
-        risk_adjustment += purpose_risk.get(loan_purpose, 15)
+        risk_adjustment += RiskScoringEngine.PURPOSE_RISK.get(loan_purpose, 15)
 
         return min(risk_adjustment, 25)
 
@@ -126,10 +135,10 @@ class RiskScoringEngine:
         Returns:
             Risk level string
         """
-        for level, (min_score, max_score) in RiskScoringEngine.RISK_THRESHOLDS.items():
-            if min_score <= risk_score <= max_score:
-                return level
-        return "high"
+        index = bisect_left(RiskScoringEngine._RISK_LEVEL_BOUNDS, risk_score)
+        if index == len(RiskScoringEngine._RISK_LEVELS):
+            return "high"
+        return RiskScoringEngine._RISK_LEVELS[index]
 
 
 class DecisionEngine:
@@ -132,7 +132,7 @@ class ConservativeDecisionStrategy(DecisionStrategy):
             "Rationale:",
         ]
 
-        if decision == DecisionStatus.APPROVED:
+        if decision is DecisionStatus.APPROVED:
             parts.append(
                 f"✓ Low risk profile (score {context.risk_score} ≤ {self.THRESHOLDS['approve_risk_max']})"
             )
@@ -140,7 +140,7 @@ class ConservativeDecisionStrategy(DecisionStrategy):
                 f"✓ High confidence ({context.confidence_score:.1%} ≥ {self.THRESHOLDS['approve_confidence_min']:.0%})"
             )
             parts.append("✓ All analysis agents completed successfully")
-        elif decision == DecisionStatus.REJECTED:
+        elif decision is DecisionStatus.REJECTED:
             if context.risk_score > self.THRESHOLDS["review_risk_max"]:
                 parts.append(
                     f"✗ High risk score ({context.risk_score} > {self.THRESHOLDS['review_risk_max']})"
@@ -4,10 +4,13 @@ from loanai_agent.tools.analysis_tools import (
     EmploymentVerifier,
     FinancialAnalyzer,
     DocumentProcessor,
+    get_document_processor,
 )
 from loanai_agent.tools.verification_tools import (
     ExternalDataFetcher,
     WebVerificationTools,
+    get_data_fetcher,
+    get_web_tools,
 )
 
 __all__ = [
@@ -16,4 +19,7 @@ __all__ = [
     "EmploymentVerifier",
     "WebVerificationTools",
     "ExternalDataFetcher",
+    "get_document_processor",
+    "get_web_tools",
+    "get_data_fetcher",
 ]
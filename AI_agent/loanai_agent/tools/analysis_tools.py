@@ -1,7 +1,11 @@
 """Document processing and analysis tools."""
 
+import copy
+import hashlib
 import json
 import os
+import tempfile
+import threading
 import time
 from typing import Any, Dict, List, Optional
 
@@ -24,12 +28,23 @@ except ImportError:
     SalaryStatementData = None
     PromptTemplates = None
 
-from loanai_agent.utils import DocumentProcessingException
+from loanai_agent.utils import DocumentProcessingException, TTLCache
 from loanai_agent.utils.gcs_client import get_gcs_client
 from loanai_agent.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed LLM results and Document AI text keyed by (kind, content digest).
+# Shared across processors and guarded by a lock because parsing runs in
+# worker threads.
+_parse_cache = TTLCache(maxsize=512, ttl=86400)
+_parse_cache_lock = threading.Lock()
+
+
+def _content_digest(file_content: bytes) -> str:
+    """Return a short digest identifying document content."""
+    return hashlib.blake2b(file_content, digest_size=16).hexdigest()
+
 
 class DocumentProcessor:
     """Production-ready document processor with template-based prompts and validation."""
@@ -82,136 +97,6 @@ class DocumentProcessor:
                 logger.warning(f"Failed to initialize GCS client: {e}. Falling back to simulation mode.")
                 self.use_document_ai = False
 
-    def parse_bank_statement(self, document_path: str, file_content: Optional[bytes] = None) -> Dict[str, Any]:
-        """Parse bank statement with template-based prompts and validation.
-        
-        Args:
-            document_path: GCS path or local path to document
-            file_content: Optional pre-loaded file content as bytes
-            
-        Returns:
-            Structured and validated bank statement data as dictionary
-            
-        Raises:
-            DocumentProcessingException: If parsing or validation fails
-        """
-        start_time = time.time()
-        logger.info(f"Parsing bank statement from {document_path}")
-        
-        try:
-            # Get file content if not provided
-            if file_content is None:
-                file_content = self._load_document_content(document_path)
-            
-            # Use LLM with structured template
-            if not self.model:
-                logger.warning("Gemini model not available, using simulated data")
-                return self._get_simulated_bank_data()
-            
-            # Check if templates are available
-            if TEMPLATES_AVAILABLE and BankStatementData and PromptTemplates:
-                # Generate prompt from template
-                schema = BankStatementData.schema_json(indent=2)
-                prompt = PromptTemplates.BANK_STATEMENT.render(schema=schema)
-                
-                # Analyze with LLM
-                result_data = self._analyze_with_llm(
-                    file_content=file_content,
-                    document_path=document_path,
-                    prompt=prompt,
-                )
-                
-                # Validate with Pydantic model
-                validated_data = BankStatementData.parse_obj(result_data)
-                result = validated_data.dict()
-            else:
-                # Fallback to legacy method
-                logger.warning("Templates not available, using legacy parsing")
-                result = self._analyze_bank_statement_legacy(file_content, document_path)
-            
-            # Record success metrics
-            processing_time = time.time() - start_time
-            self._record_metric("bank_statement", True, processing_time)
-            
-            logger.info(f"Successfully parsed bank statement in {processing_time:.2f}s")
-            return result
-            
-        except ValidationError as e:
-            processing_time = time.time() - start_time
-            self._record_metric("bank_statement", False, processing_time, "validation_error")
-            logger.error(f"Validation failed for bank statement: {e}")
-            raise DocumentProcessingException(f"Invalid bank statement format: {e}") from e
-        except Exception as e:
-            processing_time = time.time() - start_time
-            self._record_metric("bank_statement", False, processing_time, "processing_error")
-            logger.error(f"Error parsing bank statement: {e}", exc_info=True)
-            raise DocumentProcessingException(f"Failed to parse bank statement: {e}") from e
-
-    def parse_salary_statement(self, document_path: str, file_content: Optional[bytes] = None) -> Dict[str, Any]:
-        """Parse salary statement with template-based prompts and validation.
-        
-        Args:
-            document_path: GCS path or local path to document
-            file_content: Optional pre-loaded file content as bytes
-            
-        Returns:
-            Structured and validated salary statement data as dictionary
-            
-        Raises:
-            DocumentProcessingException: If parsing or validation fails
-        """
-        start_time = time.time()
-        logger.info(f"Parsing salary statement from {document_path}")
-        
-        try:
-            # Get file content if not provided
-            if file_content is None:
-                file_content = self._load_document_content(document_path)
-            
-            # Use LLM with structured template
-            if not self.model:
-                logger.warning("Gemini model not available, using simulated data")
-                return self._get_simulated_salary_data()
-            
-            # Check if templates are available
-            if TEMPLATES_AVAILABLE and SalaryStatementData and PromptTemplates:
-                # Generate prompt from template
-                schema = SalaryStatementData.schema_json(indent=2)
-                prompt = PromptTemplates.SALARY_STATEMENT.render(schema=schema)
-                
-                # Analyze with LLM
-                result_data = self._analyze_with_llm(
-                    file_content=file_content,
-                    document_path=document_path,
-                    prompt=prompt,
-                )
-                
-                # Validate with Pydantic model
-                validated_data = SalaryStatementData.parse_obj(result_data)
-                result = validated_data.dict()
-            else:
-                # Fallback to legacy method
-                logger.warning("Templates not available, using legacy parsing")
-                result = self._get_simulated_salary_data()
-            
-            # Record success metrics
-            processing_time = time.time() - start_time
-            self._record_metric("salary_statement", True, processing_time)
-            
-            logger.info(f"Successfully parsed salary statement in {processing_time:.2f}s")
-            return result
-            
-        except ValidationError as e:
-            processing_time = time.time() - start_time
-            self._record_metric("salary_statement", False, processing_time, "validation_error")
-            logger.error(f"Validation failed for salary statement: {e}")
-            raise DocumentProcessingException(f"Invalid salary statement format: {e}") from e
-        except Exception as e:
-            processing_time = time.time() - start_time
-            self._record_metric("salary_statement", False, processing_time, "processing_error")
-            logger.error(f"Error parsing salary statement: {e}", exc_info=True)
-            raise DocumentProcessingException(f"Failed to parse salary statement: {e}") from e
-
     def _load_document_content(self, document_path: str) -> bytes:
         """Load document content from GCS or local file system.
         
@@ -256,8 +141,6 @@ class DocumentProcessor:
         Raises:
             DocumentProcessingException: If LLM analysis fails
         """
-        import tempfile
-        
         try:
             # Determine mime type
             mime_type = self._get_mime_type_from_path(document_path)
@@ -462,6 +345,13 @@ class DocumentProcessor:
         Returns:
             Extracted text
         """
+        cache_key = ("document_text", document_type, _content_digest(file_content))
+        with _parse_cache_lock:
+            cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached Document AI extraction")
+            return cached
+
         try:
             from google.cloud import documentai_v1 as documentai
             
@@ -496,6 +386,8 @@ class DocumentProcessor:
             extracted_text = document.text
             
             logger.info(f"Successfully extracted {len(extracted_text)} characters from document")
+            with _parse_cache_lock:
+                _parse_cache[cache_key] = extracted_text
             return extracted_text
             
         except ImportError:
@@ -612,6 +504,13 @@ class DocumentProcessor:
         Returns:
             Structured bank statement data
         """
+        cache_key = ("bank_statement", _content_digest(file_content))
+        with _parse_cache_lock:
+            cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached bank statement parse for {document_path}")
+            return copy.deepcopy(cached)
+        
         try:
             # Determine mime type
             mime_type = self._get_mime_type_from_path(document_path)
@@ -641,7 +540,6 @@ Extract ALL transactions from the statement. Be precise with numbers and dates.
 Return ONLY valid JSON, no additional text."""
 
             # Upload file and generate content
-            import tempfile
             with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(document_path)[1]) as tmp:
                 tmp.write(file_content)
                 tmp_path = tmp.name
@@ -662,6 +560,8 @@ Return ONLY valid JSON, no additional text."""
                 
                 parsed_data = json.loads(response_text.strip())
                 logger.info(f"Successfully parsed bank statement with {len(parsed_data.get('transactions', []))} transactions")
+                with _parse_cache_lock:
+                    _parse_cache[cache_key] = copy.deepcopy(parsed_data)
                 return parsed_data
                 
             finally:
@@ -750,6 +650,13 @@ Return ONLY valid JSON, no additional text."""
         Returns:
             Structured salary statement data
         """
+        cache_key = ("salary_statement", _content_digest(file_content))
+        with _parse_cache_lock:
+            cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached salary statement parse for {document_path}")
+            return copy.deepcopy(cached)
+
         try:
             # Determine mime type
             mime_type = self._get_mime_type_from_path(document_path)
@@ -778,7 +685,6 @@ Return ONLY valid JSON, no additional text."""
 Be precise with numbers. If information is not available, use null.
 Return ONLY valid JSON, no additional text."""
 
-            import tempfile
             with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(document_path)[1]) as tmp:
                 tmp.write(file_content)
                 tmp_path = tmp.name
@@ -799,6 +705,8 @@ Return ONLY valid JSON, no additional text."""
                 
                 parsed_data = json.loads(response_text.strip())
                 logger.info(f"Successfully parsed salary statement for {parsed_data.get('employee_name', 'Unknown')}")
+                with _parse_cache_lock:
+                    _parse_cache[cache_key] = copy.deepcopy(parsed_data)
                 return parsed_data
                 
             finally:
@@ -836,49 +744,102 @@ Return ONLY valid JSON, no additional text."""
         return mime_types.get(ext, 'application/pdf')
 
 
+# Global document processor instance
+_document_processor: Optional[DocumentProcessor] = None
+
+
+def get_document_processor() -> DocumentProcessor:
+    """Get or create global document processor instance."""
+    global _document_processor
+    if _document_processor is None:
+        _document_processor = DocumentProcessor()
+    return _document_processor
+
+
 class FinancialAnalyzer:
     """Tools for financial analysis and metrics calculation."""
 
+    @staticmethod
+    def summarize_transactions(transactions: List[Dict]) -> Dict[str, Any]:
+        """Aggregate the transaction metrics used by the analysis in one pass.
+        
+        Args:
+            transactions: Parsed bank statement transactions
+            
+        Returns:
+            Dictionary with transaction_count, total_credits, total_debits,
+            salary_credits (count of salary deposits) and large_transactions
+            (count of transactions above 10,000)
+        """
+        total_credits = 0
+        total_debits = 0
+        salary_credits = 0
+        large_transactions = 0
+
+        for t in transactions:
+            amount = t.get("amount", 0)
+            transaction_type = t.get("type")
+            if transaction_type == "credit":
+                total_credits += amount
+                if "salary" in t.get("description", "").lower():
+                    salary_credits += 1
+            elif transaction_type == "debit":
+                total_debits += amount
+            if abs(amount) > 10000:
+                large_transactions += 1
+
+        return {
+            "transaction_count": len(transactions),
+            "total_credits": total_credits,
+            "total_debits": total_debits,
+            "salary_credits": salary_credits,
+            "large_transactions": large_transactions,
+        }
+
     @staticmethod
     def calculate_income_consistency(transactions: List[Dict]) -> float:
         """Calculate income consistency score (0-1)."""
-        logger.info("Calculating income consistency")
-
-        if not transactions:
-            return 0.0
+        return FinancialAnalyzer.income_consistency_from_summary(
+            FinancialAnalyzer.summarize_transactions(transactions)
+        )
 
-        income_transactions = [
-            t for t in transactions if t.get("type") == "credit" and "salary" in t.get("description", "").lower()
-        ]
+    @staticmethod
+    def income_consistency_from_summary(summary: Dict[str, Any]) -> float:
+        """Calculate income consistency score (0-1) from a transaction summary."""
+        logger.info("Calculating income consistency")
 
-        if not income_transactions:
-            return 0.0
+        salary_credits = summary["salary_credits"]
 
         # Simple consistency check: if we have multiple regular deposits, high consistency
-        if len(income_transactions) >= 3:
+        if salary_credits >= 3:
             return 0.9
-        elif len(income_transactions) >= 2:
+        elif salary_credits >= 2:
             return 0.7
-        else:
+        elif salary_credits >= 1:
             return 0.4
+        else:
+            return 0.0
 
     @staticmethod
     def detect_fraud_indicators(transactions: List[Dict]) -> List[str]:
         """Detect potential fraud indicators in transaction data."""
+        return FinancialAnalyzer.fraud_indicators_from_summary(
+            FinancialAnalyzer.summarize_transactions(transactions)
+        )
+
+    @staticmethod
+    def fraud_indicators_from_summary(summary: Dict[str, Any]) -> List[str]:
+        """Detect potential fraud indicators from a transaction summary."""
         logger.info("Detecting fraud indicators")
 
         red_flags = []
 
         # Check for unusual transaction patterns
-        large_transactions = [
-            t for t in transactions if abs(t.get("amount", 0)) > 10000
-        ]
-        if large_transactions:
+        if summary["large_transactions"]:
             red_flags.append("Large unusual transactions detected")
 
         # Check for rapid account draining
-        debits = [t for t in transactions if t.get("type") == "debit"]
-        if debits and sum(t.get("amount", 0) for t in debits) > 50000:
+        if summary["total_debits"] > 50000:
             red_flags.append("Unusually high debit activity")
 
         return red_flags
@@ -1,39 +1,219 @@
 """Verification and web search tools."""
 
-import requests
-from typing import Any, Dict, List
+import asyncio
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from loanai_agent.utils.cache import TTLCache
 from loanai_agent.utils.logger import get_logger
+from loanai_agent.utils.throttle import Throttle
 
 logger = get_logger(__name__)
 
-# Cache to avoid repeated API calls
-_verification_cache = {}
-_cache_expiry = 3600  # 1 hour
+# Cache to avoid repeated API calls. University and company facts change over
+# weeks, geocoding less predictably. Lookups run in worker threads, so access
+# is guarded by a lock, and concurrent lookups of the same key share a single
+# in-flight request.
+_verification_caches = {
+    "university": TTLCache(maxsize=1024, ttl=86400),
+    "company": TTLCache(maxsize=1024, ttl=86400),
+    "address": TTLCache(maxsize=4096, ttl=3600),
+}
+_verification_lock = threading.Lock()
+_inflight: Dict[Tuple[str, str], Future] = {}
+
+# One keep-alive connection pool shared by every lookup, so repeated
+# applications reuse TCP/TLS connections to Wikipedia and Nominatim
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Per-API limits so bursts of applications queue here instead of tripping
+# upstream rate limits. Nominatim's usage policy allows one request a second.
+_throttles = {
+    "wikipedia": Throttle(max_concurrent=8, max_calls=200, period=60),
+    "nominatim": Throttle(max_concurrent=1, max_calls=1, period=1),
+}
+
+# Lookups run on one pool per API, no larger than the API's throttle, rather
+# than the default executor that also parses documents. Excess lookups wait
+# in the pool queue without holding a thread, and a lookup abandoned there
+# (e.g. by an agent timeout) is dropped before it starts.
+_lookup_executors = {
+    "wikipedia": ThreadPoolExecutor(max_workers=8, thread_name_prefix="wikipedia-lookup"),
+    "nominatim": ThreadPoolExecutor(max_workers=1, thread_name_prefix="nominatim-lookup"),
+}
+
+
+def _get(api: str, url: str, **kwargs: Any) -> requests.Response:
+    """GET ``url`` over the shared session, within ``api``'s throttle."""
+    with _throttles[api]:
+        return _http_session.get(url, **kwargs)
+
+
+async def _run_lookup(
+    api: str, lookup: Callable[..., Dict[str, Any]], *args: Any
+) -> Dict[str, Any]:
+    """Run a blocking lookup against ``api`` on that API's thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_lookup_executors[api], lookup, *args)
+
+
+def _cached_lookup(kind: str, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a cached verification result, fetching it at most once per key.
+
+    Results carrying an ``error`` (API failures) are returned but not cached.
+
+    Args:
+        kind: Lookup kind, selecting the cache
+        key: Normalized lookup key
+        fetch: Performs the lookup on a cache miss
+
+    Returns:
+        Verification result
+    """
+    cache = _verification_caches[kind]
+    with _verification_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached {kind} verification for: {key}")
+            return cached
+        future = _inflight.get((kind, key))
+        owner = future is None
+        if owner:
+            future = _inflight[(kind, key)] = Future()
+
+    if not owner:
+        # Another thread is already fetching this key; share its result
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        with _verification_lock:
+            del _inflight[(kind, key)]
+        future.set_exception(e)
+        raise
+
+    with _verification_lock:
+        if "error" not in result:
+            cache[key] = result
+        del _inflight[(kind, key)]
+    future.set_result(result)
+    return result
+
+
+_WIKI_URL = "https://en.wikipedia.org/w/api.php"
+_WIKI_HEADERS = {
+    "User-Agent": "LoanAI-Bot/1.0 (Loan Application Verification System; +https://github.com/ujera/LoanAI)"
+}
+
+
+class _ExtractBatcher:
+    """Coalesce Wikipedia page-extract requests from concurrent lookups.
+
+    The first request in a window waits ``window`` seconds for others to
+    join, then fetches every pending title with one multi-title query
+    (the API returns intro extracts for up to 20 titles per request).
+    """
+
+    def __init__(self, window: float = 0.02, max_titles: int = 20):
+        self.window = window
+        self.max_titles = max_titles
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def fetch(self, title: str) -> Dict[str, Any]:
+        """Get the page for ``title``, or an empty dict if it has none.
+
+        Raises:
+            requests.exceptions.RequestException: If the batch request failed
+        """
+        with self._lock:
+            future = self._pending.get(title)
+            if future is None:
+                future = self._pending[title] = Future()
+                leader = len(self._pending) == 1
+            else:
+                leader = False
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            titles = list(batch)
+            for i in range(0, len(titles), self.max_titles):
+                self._fetch_batch({t: batch[t] for t in titles[i:i + self.max_titles]})
+
+        return future.result()
+
+    @staticmethod
+    def _fetch_batch(batch: Dict[str, Future]) -> None:
+        """Fetch extracts for ``batch`` titles and resolve their futures."""
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "extracts",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "titles": "|".join(batch),
+        }
+        try:
+            response = _get("wikipedia", _WIKI_URL, params=params, headers=_WIKI_HEADERS, timeout=5)
+            query = response.json().get("query", {})
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        pages = {page.get("title"): page for page in query.get("pages", {}).values()}
+        normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+        for title, future in batch.items():
+            future.set_result(pages.get(normalized.get(title, title), {}))
+
+
+_extracts = _ExtractBatcher()
 
 
 class WebVerificationTools:
     """Tools for verifying information using web search and APIs."""
 
+    @staticmethod
+    async def verify_university_async(university_name: str) -> Dict[str, Any]:
+        """Run ``verify_university`` on the Wikipedia lookup pool."""
+        return await _run_lookup(
+            "wikipedia", WebVerificationTools.verify_university, university_name
+        )
+
+    @staticmethod
+    async def verify_company_async(company_name: str) -> Dict[str, Any]:
+        """Run ``verify_company`` on the Wikipedia lookup pool."""
+        return await _run_lookup("wikipedia", WebVerificationTools.verify_company, company_name)
+
+    @staticmethod
+    async def verify_address_async(address: str) -> Dict[str, Any]:
+        """Run ``verify_address`` on the Nominatim lookup pool."""
+        return await _run_lookup("nominatim", WebVerificationTools.verify_address, address)
+
     @staticmethod
     def verify_university(university_name: str) -> Dict[str, Any]:
         """Verify university using web search and APIs."""
+        return _cached_lookup(
+            "university", university_name.lower(), lambda: WebVerificationTools._fetch_university(university_name)
+        )
+
+    @staticmethod
+    def _fetch_university(university_name: str) -> Dict[str, Any]:
+        """Uncached university lookup behind ``verify_university``."""
         logger.info(f"Verifying university: {university_name}")
         
-        # Check cache first
-        cache_key = f"university_{university_name.lower()}"
-        if cache_key in _verification_cache:
-            cached_data, timestamp = _verification_cache[cache_key]
-            if time.time() - timestamp < _cache_expiry:
-                logger.info(f"Using cached data for university: {university_name}")
-                return cached_data
-        
         try:
             # Use Wikipedia API to verify university
-            wiki_url = "https://en.wikipedia.org/w/api.php"
-            headers = {
-                "User-Agent": "LoanAI-Bot/1.0 (Loan Application Verification System; +https://github.com/ujera/LoanAI)"
-            }
             params = {
                 "action": "query",
                 "format": "json",
@@ -43,7 +223,7 @@ class WebVerificationTools:
                 "srlimit": 3
             }
             
-            response = requests.get(wiki_url, params=params, headers=headers, timeout=5)
+            response = _get("wikipedia", _WIKI_URL, params=params, headers=_WIKI_HEADERS, timeout=5)
             response.raise_for_status()
             data = response.json()
             
@@ -63,23 +243,9 @@ class WebVerificationTools:
                 }
                 
                 # Try to get more details from the first result
-                page_title = search_results[0].get("title")
-                detail_params = {
-                    "action": "query",
-                    "format": "json",
-                    "prop": "extracts|pageimages",
-                    "exintro": 1,
-                    "explaintext": 1,
-                    "titles": page_title,
-                    "piprop": "thumbnail"
-                }
+                page = _extracts.fetch(search_results[0].get("title"))
                 
-                detail_response = requests.get(wiki_url, params=detail_params, headers=headers, timeout=5)
-                detail_data = detail_response.json()
-                pages = detail_data.get("query", {}).get("pages", {})
-                
-                if pages:
-                    page = next(iter(pages.values()))
+                if page:
                     extract = page.get("extract", "")
                     
                     # Try to extract country from text
@@ -92,8 +258,6 @@ class WebVerificationTools:
                     
                     result["description"] = extract[:200] + "..." if len(extract) > 200 else extract
                 
-                # Cache the result
-                _verification_cache[cache_key] = (result, time.time())
                 return result
             else:
                 # Not found on Wikipedia - could still be legitimate but less confidence
@@ -108,7 +272,6 @@ class WebVerificationTools:
                     "confidence": 0.3,
                     "warning": "Could not verify university through web sources"
                 }
-                _verification_cache[cache_key] = (result, time.time())
                 return result
                 
         except requests.exceptions.RequestException as e:
@@ -128,22 +291,17 @@ class WebVerificationTools:
     @staticmethod
     def verify_company(company_name: str) -> Dict[str, Any]:
         """Verify company legitimacy using web APIs."""
+        return _cached_lookup(
+            "company", company_name.lower(), lambda: WebVerificationTools._fetch_company(company_name)
+        )
+
+    @staticmethod
+    def _fetch_company(company_name: str) -> Dict[str, Any]:
+        """Uncached company lookup behind ``verify_company``."""
         logger.info(f"Verifying company: {company_name}")
         
-        # Check cache first
-        cache_key = f"company_{company_name.lower()}"
-        if cache_key in _verification_cache:
-            cached_data, timestamp = _verification_cache[cache_key]
-            if time.time() - timestamp < _cache_expiry:
-                logger.info(f"Using cached data for company: {company_name}")
-                return cached_data
-        
         try:
             # Use Wikipedia API to verify company
-            wiki_url = "https://en.wikipedia.org/w/api.php"
-            headers = {
-                "User-Agent": "LoanAI-Bot/1.0 (Loan Application Verification System; +https://github.com/ujera/LoanAI)"
-            }
             params = {
                 "action": "query",
                 "format": "json",
@@ -153,7 +311,7 @@ class WebVerificationTools:
                 "srlimit": 3
             }
             
-            response = requests.get(wiki_url, params=params, headers=headers, timeout=5)
+            response = _get("wikipedia", _WIKI_URL, params=params, headers=_WIKI_HEADERS, timeout=5)
             response.raise_for_status()
             data = response.json()
             
@@ -174,22 +332,9 @@ class WebVerificationTools:
                 }
                 
                 # Try to get more details
-                page_title = search_results[0].get("title")
-                detail_params = {
-                    "action": "query",
-                    "format": "json",
-                    "prop": "extracts",
-                    "exintro": 1,
-                    "explaintext": 1,
-                    "titles": page_title
-                }
-                
-                detail_response = requests.get(wiki_url, params=detail_params, headers=headers, timeout=5)
-                detail_data = detail_response.json()
-                pages = detail_data.get("query", {}).get("pages", {})
+                page = _extracts.fetch(search_results[0].get("title"))
                 
-                if pages:
-                    page = next(iter(pages.values()))
+                if page:
                     extract = page.get("extract", "")
                     
                     # Try to extract industry from text
@@ -209,8 +354,6 @@ class WebVerificationTools:
                     
                     result["description"] = extract[:200] + "..." if len(extract) > 200 else extract
                 
-                # Cache the result
-                _verification_cache[cache_key] = (result, time.time())
                 return result
             else:
                 # Not found - could be small/local company
@@ -226,7 +369,6 @@ class WebVerificationTools:
                     "confidence": 0.3,
                     "warning": "Could not verify company through web sources - may be small/local business"
                 }
-                _verification_cache[cache_key] = (result, time.time())
                 return result
                 
         except requests.exceptions.RequestException as e:
@@ -291,16 +433,15 @@ class WebVerificationTools:
     @staticmethod
     def verify_address(address: str) -> Dict[str, Any]:
         """Verify address using geocoding API."""
+        return _cached_lookup(
+            "address", address.lower(), lambda: WebVerificationTools._fetch_address(address)
+        )
+
+    @staticmethod
+    def _fetch_address(address: str) -> Dict[str, Any]:
+        """Uncached address lookup behind ``verify_address``."""
         logger.info(f"Verifying address: {address}")
         
-        # Check cache first
-        cache_key = f"address_{address.lower()}"
-        if cache_key in _verification_cache:
-            cached_data, timestamp = _verification_cache[cache_key]
-            if time.time() - timestamp < _cache_expiry:
-                logger.info(f"Using cached data for address: {address}")
-                return cached_data
-        
         try:
             # Use Nominatim (OpenStreetMap) API for geocoding
             geocode_url = "https://nominatim.openstreetmap.org/search"
@@ -314,7 +455,7 @@ class WebVerificationTools:
                 "addressdetails": 1
             }
             
-            response = requests.get(geocode_url, params=params, headers=headers, timeout=5)
+            response = _get("nominatim", geocode_url, params=params, headers=headers, timeout=5)
             response.raise_for_status()
             data = response.json()
             
@@ -336,8 +477,6 @@ class WebVerificationTools:
                     "display_name": location.get("display_name", "")
                 }
                 
-                # Cache the result
-                _verification_cache[cache_key] = (result, time.time())
                 return result
             else:
                 logger.warning(f"Address not found: {address}")
@@ -354,7 +493,6 @@ class WebVerificationTools:
                     "confidence": 0.0,
                     "warning": "Could not geocode address"
                 }
-                _verification_cache[cache_key] = (result, time.time())
                 return result
                 
         except requests.exceptions.RequestException as e:
@@ -451,3 +589,24 @@ class ExternalDataFetcher:
             "variance_from_bank": round(variance_bank, 2),
             "all_sources_consistent": variance_employment < 10 and variance_bank < 10,
         }
+
+
+# Global verification tool instances
+_web_tools: Optional[WebVerificationTools] = None
+_data_fetcher: Optional[ExternalDataFetcher] = None
+
+
+def get_web_tools() -> WebVerificationTools:
+    """Get or create global web verification tools instance."""
+    global _web_tools
+    if _web_tools is None:
+        _web_tools = WebVerificationTools()
+    return _web_tools
+
+
+def get_data_fetcher() -> ExternalDataFetcher:
+    """Get or create global external data fetcher instance."""
+    global _data_fetcher
+    if _data_fetcher is None:
+        _data_fetcher = ExternalDataFetcher()
+    return _data_fetcher
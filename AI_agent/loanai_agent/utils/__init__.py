@@ -1,5 +1,6 @@
 """Utilities package initialization."""
 
+from loanai_agent.utils.cache import TTLCache
 from loanai_agent.utils.config_validator import (
     ConfigurationValidator,
     get_validation_report,
@@ -33,9 +34,12 @@ from loanai_agent.utils.helpers import (
     truncate_string,
 )
 from loanai_agent.utils.logger import get_logger
+from loanai_agent.utils.throttle import Throttle
 
 __all__ = [
     "get_logger",
+    "TTLCache",
+    "Throttle",
     "LoanAIException",
     "AgentException",
     "CommunicationException",
@@ -0,0 +1,131 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Any, Callable, Hashable, Iterator, Tuple
+
+
+class TTLCache(MutableMapping):
+    """Mapping bounded by size and entry age.
+
+    Entries expire ``ttl`` seconds after they were last written. When the
+    cache is full, the least recently used entry is evicted. Not thread-safe;
+    intended for use from a single event loop.
+
+    Reads via ``cache[key]`` and ``get`` refresh recency; ``in`` and
+    iteration do not.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry time-to-live in seconds
+            timer: Clock used for expiry (monotonic by default)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        # Ordered by access, for LRU eviction
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        # Ordered by write; the TTL is uniform, so this is also expiry order
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value, expires_at = self._data[key]
+        if expires_at <= self._timer():
+            del self[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self.expire()
+            while len(self._data) >= self.maxsize:
+                lru_key, _ = self._data.popitem(last=False)
+                del self._expiry[lru_key]
+        expires_at = self._timer() + self.ttl
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        self._expiry.pop(key, None)
+        self._expiry[key] = expires_at
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+        del self._expiry[key]
+
+    def __contains__(self, key: object) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[1] > self._timer()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        self.expire()
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def values(self) -> ValuesView:
+        """Return a lazy view of live values that leaves recency untouched."""
+        return _TTLCacheValuesView(self)
+
+    def items(self) -> ItemsView:
+        """Return a lazy view of live items that leaves recency untouched."""
+        return _TTLCacheItemsView(self)
+
+    def expire(self) -> int:
+        """Remove all expired entries.
+
+        Only the expired prefix of the write order is visited, so the cost is
+        proportional to the number of entries removed.
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._timer()
+        removed = 0
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            del self[key]
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._expiry.clear()
+
+    def __repr__(self) -> str:
+        """String representation of cache."""
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self._data)})"
+
+
+class _TTLCacheValuesView(ValuesView):
+    """Values view over a TTLCache that does not refresh recency."""
+
+    def __iter__(self) -> Iterator[Any]:
+        self._mapping.expire()
+        for value, _ in self._mapping._data.values():
+            yield value
+
+
+class _TTLCacheItemsView(ItemsView):
+    """Items view over a TTLCache that does not refresh recency."""
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, Any]]:
+        self._mapping.expire()
+        for key, (value, _) in self._mapping._data.items():
+            yield key, value
@@ -1,6 +1,7 @@
 """Helper functions and utilities."""
 
 import json
+import re
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
@@ -8,6 +9,8 @@ from loanai_agent.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID for tracking."""
@@ -103,10 +106,7 @@ def normalize_phone(phone: str) -> str:
 
 def is_valid_email(email: str) -> bool:
     """Simple email validation."""
-    import re
-
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return _EMAIL_PATTERN.match(email) is not None
 
 
 def round_to_nearest(value: float, nearest: float = 0.01) -> float:
@@ -0,0 +1,67 @@
+"""Outbound request throttling."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+
+class Throttle:
+    """Cap concurrent calls and calls per time window to one endpoint.
+
+    Used as a context manager around each outbound request. Entering blocks
+    until a concurrency slot is free and the sliding window has room, so it
+    is meant for worker threads, not the event loop. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_calls: int,
+        period: float,
+        timer: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the throttle.
+
+        Args:
+            max_concurrent: Maximum calls in flight at once
+            max_calls: Maximum calls started per ``period``
+            period: Sliding window length in seconds
+            timer: Clock used for the window (monotonic by default)
+            sleep: Called to wait for room in the window
+        """
+        if max_concurrent <= 0 or max_calls <= 0:
+            raise ValueError("max_concurrent and max_calls must be positive")
+        self.max_calls = max_calls
+        self.period = period
+        self._timer = timer
+        self._sleep = sleep
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        # Start times of calls within the current window, oldest first
+        self._started: "deque[float]" = deque()
+
+    def __enter__(self) -> "Throttle":
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    now = self._timer()
+                    while self._started and self._started[0] <= now - self.period:
+                        self._started.popleft()
+                    if len(self._started) < self.max_calls:
+                        self._started.append(now)
+                        return self
+                    wait = self._started[0] + self.period - now
+                self._sleep(wait)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def __exit__(self, *exc_info) -> None:
+        self._slots.release()
+
+    def __repr__(self) -> str:
+        """String representation of throttle."""
+        return f"{self.__class__.__name__}(max_calls={self.max_calls}, period={self.period})"
@@ -0,0 +1,594 @@
+"""Tests for agent helpers."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from loanai_agent import LoanApplicationProcessor, get_processor, main
+from loanai_agent.agents import (
+    BankStatementAgent,
+    LoanOfficerAgent,
+    SalaryStatementAgent,
+    VerificationAgent,
+)
+from loanai_agent.agents import bank_statement, loan_officer
+from loanai_agent.agents.base_agent import AnalysisAgent
+from loanai_agent.models import BankStatementAnalysis
+from loanai_agent.protocols import AgentCommunicationHub
+from loanai_agent.utils import AgentException, DocumentProcessingException
+
+
+class FlakyProcessor:
+    """Document processor that fails a set number of times."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def parse_bank_statement(self, file_path):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"transactions": []}
+
+
+def _agent_with_processor(processor):
+    agent = BankStatementAgent()
+    agent.document_processor = processor
+    return agent
+
+
+async def test_parse_retries_transient_errors(monkeypatch):
+    """Test that transient parse errors are retried with a short backoff."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(bank_statement.asyncio, "sleep", fake_sleep)
+    processor = FlakyProcessor([ConnectionError("reset"), TimeoutError("slow")])
+
+    result = await _agent_with_processor(processor)._parse_with_retry("doc.pdf")
+
+    assert result == {"transactions": []}
+    assert processor.calls == 3
+    assert all(0.1 <= delay <= 0.6 for delay in delays)
+
+
+async def test_parse_does_not_retry_deterministic_errors():
+    """Test that errors that cannot succeed on retry fail immediately."""
+    processor = FlakyProcessor([FileNotFoundError("doc.pdf")])
+
+    with pytest.raises(DocumentProcessingException):
+        await _agent_with_processor(processor)._parse_with_retry("doc.pdf")
+
+    assert processor.calls == 1
+
+
+async def test_analyze_bank_data_returns_model():
+    """Test that bank analysis builds the typed result directly."""
+    agent = BankStatementAgent()
+    bank_data = {
+        "opening_balance": 5000.0,
+        "closing_balance": 7000.0,
+        "transactions": [
+            {"type": "credit", "amount": 6000.0, "description": "Salary"},
+            {"type": "debit", "amount": 1500.0, "description": "Rent"},
+        ],
+    }
+
+    analysis = await agent._analyze_bank_data(bank_data, reported_salary=2000.0)
+
+    assert isinstance(analysis, BankStatementAnalysis)
+    assert analysis.average_monthly_income == 2000.0
+    assert analysis.income_consistency == "low"
+    assert analysis.savings_behavior == "positive"
+    assert analysis.debt_indicators["estimated_monthly_debt"] == 450.0
+
+
+class SlowAgent:
+    """Sub-agent stub that records how many analyses overlap."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, result):
+        self.result = result
+
+    async def analyze(self, application):
+        SlowAgent.running += 1
+        SlowAgent.peak = max(SlowAgent.peak, SlowAgent.running)
+        await asyncio.sleep(0)
+        SlowAgent.running -= 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+async def test_loan_officer_runs_sub_agents_concurrently(sample_application):
+    """Test that sub-agents overlap and a failing one is left out."""
+    SlowAgent.running = SlowAgent.peak = 0
+
+    results = await LoanOfficerAgent()._perform_analysis(
+        sample_application,
+        bank_agent=SlowAgent({"risk_score": 20}),
+        salary_agent=SlowAgent(RuntimeError("llm down")),
+        verification_agent=SlowAgent({"risk_score": 30}),
+    )
+
+    assert SlowAgent.peak == 3
+    assert results["bank_analysis"] == {"risk_score": 20}
+    assert results["verification_analysis"] == {"risk_score": 30}
+    assert "salary_analysis" not in results
+    assert results["application"] is sample_application
+
+
+async def test_loan_officer_override_skips_threshold_decision(monkeypatch):
+    """Test that a fraud override rejects without running the threshold logic."""
+    agent = LoanOfficerAgent()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("threshold decision should be skipped")
+
+    monkeypatch.setattr(LoanOfficerAgent, "_make_final_decision", fail)
+    monkeypatch.setattr(loan_officer, "_now", lambda: datetime(2026, 1, 2, 3, 4, 5, 678))
+    result = await agent._generate_decision(
+        {
+            "bank_analysis": {"risk_score": 10, "red_flags": ["a", "b"]},
+            "salary_analysis": {"risk_score": 10, "red_flags": ["c"]},
+        }
+    )
+
+    assert result["decision"] == "REJECTED"
+    assert result["loan_amount"] is None
+    assert result["detailed_report"]["decision_timestamp"] == "2026-01-02T03:04:05"
+
+
+def test_loan_officer_aggregate_metrics_blends_consensus():
+    """Test that risk and confidence average the agents and blend consensus."""
+    bundle = loan_officer.AnalysisBundle(
+        bank={"risk_score": 20, "confidence_score": 0.9},
+        salary={"risk_score": 40, "confidence_score": 0.7},
+        consensus={"risk_score": 60, "confidence_score": 0.5},
+    )
+
+    risk, confidence = LoanOfficerAgent()._aggregate_metrics(bundle)
+
+    assert risk == 39  # int(30 * 0.7 + 60 * 0.3)
+    assert confidence == pytest.approx(0.8 * 0.7 + 0.5 * 0.3)
+    assert LoanOfficerAgent()._aggregate_metrics(loan_officer.AnalysisBundle()) == (50, 0.5)
+
+
+def test_loan_officer_conditions_follow_risk_and_red_flags():
+    """Test that conditions accumulate with risk and bank red flags, in order."""
+    agent = LoanOfficerAgent()
+    flagged = loan_officer.AnalysisBundle(bank={"red_flags": ["overdraft"]})
+
+    assert agent._generate_conditions(30, loan_officer.AnalysisBundle()) == []
+    assert agent._generate_conditions(50, flagged) == [
+        "Require additional references",
+        "Subject to fraud investigation",
+    ]
+    assert agent._generate_conditions(70, loan_officer.AnalysisBundle()) == [
+        "Require income verification",
+        "Require collateral evaluation",
+        "Require additional references",
+    ]
+
+
+async def test_run_batch_async_bounds_concurrency(sample_application):
+    """Test that batch analysis caps in-flight work and keeps input order."""
+    running = []
+    peak = []
+
+    class EchoAgent(AnalysisAgent):
+        async def _perform_analysis(self, application, **kwargs):
+            running.append(application)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.pop()
+            if application.customer_id == "bad":
+                raise ValueError("unreadable")
+            return {"customer_id": application.customer_id}
+
+    applications = [
+        sample_application.model_copy(update={"customer_id": customer_id})
+        for customer_id in ("a", "bad", "c", "d")
+    ]
+
+    results = await EchoAgent("echo", "echo").run_batch_async(applications, max_concurrency=2)
+
+    assert max(peak) == 2
+    assert results[0] == {"customer_id": "a"}
+    assert isinstance(results[1], AgentException)
+    assert [r["customer_id"] for r in results[2:]] == ["c", "d"]
+
+
+def test_loan_officer_loan_terms(sample_application):
+    """Test that terms come from the loan request and need an application."""
+    agent = LoanOfficerAgent()
+
+    terms = agent._calculate_loan_terms(
+        loan_officer.AnalysisBundle(application=sample_application), 20
+    )
+
+    assert terms["loan_amount"] == sample_application.loan_request.loan_amount
+    assert terms["loan_duration"] == sample_application.loan_request.loan_duration
+    assert terms["interest_rate"] == 8.0
+    assert agent._calculate_loan_terms(loan_officer.AnalysisBundle(), 20) == {}
+
+
+def test_analysis_bundle_from_partial_results():
+    """Test that missing analyses become None in the bundle."""
+    bank = {"risk_score": 10}
+
+    bundle = loan_officer.AnalysisBundle.from_results({"bank_analysis": bank, "status": "ok"})
+
+    assert bundle.bank is bank
+    assert bundle.salary is None and bundle.consensus is None and bundle.application is None
+
+
+class BarrierWebTools:
+    """Web tools whose lookups only finish once all three run at the same time."""
+
+    def __init__(self):
+        self.barrier = threading.Barrier(3, timeout=5)
+
+    def verify_university(self, name):
+        self.barrier.wait()
+        return {"name": name, "legitimacy": "verified"}
+
+    def verify_company(self, name):
+        self.barrier.wait()
+        return {"name": name, "legitimacy": "verified"}
+
+    def verify_address(self, address):
+        self.barrier.wait()
+        return {"address": address, "valid": True}
+
+    async def verify_university_async(self, name):
+        return await asyncio.to_thread(self.verify_university, name)
+
+    async def verify_company_async(self, name):
+        return await asyncio.to_thread(self.verify_company, name)
+
+    async def verify_address_async(self, address):
+        return await asyncio.to_thread(self.verify_address, address)
+
+    def benchmark_salary(self, job_title, location, company_name=""):
+        return {"job_title": job_title, "salary_range": {"min": 0, "max": 10**6}}
+
+
+async def test_verification_lookups_run_concurrently(sample_application):
+    """Test that the blocking web lookups overlap instead of running in sequence."""
+    agent = VerificationAgent()
+    agent.web_tools = BarrierWebTools()
+
+    result = await agent._perform_analysis(sample_application)
+
+    assert result["company_verification"]["legitimacy"] == "verified"
+    assert result["address_verification"]["valid"] is True
+    assert result["red_flags"] == []
+
+
+def test_get_processor_reuses_agents():
+    """Test that the processor and its agents are built once per process."""
+    processor = get_processor()
+
+    assert get_processor() is processor
+    assert get_processor().loan_officer is processor.loan_officer
+
+
+async def test_opening_statement_does_not_wait_for_slowest_analysis(
+    monkeypatch, sample_application
+):
+    """Test that an opening statement starts once its own analysis lands and others disagree."""
+    release = asyncio.Event()
+
+    async def quick_analysis(self, application, **kwargs):
+        recommendation = "approve" if isinstance(self, BankStatementAgent) else "review"
+        return {"recommendation": recommendation, "risk_score": 20, "confidence_score": 0.9}
+
+    async def slow_analysis(self, application, **kwargs):
+        await release.wait()
+        return {"recommendation": "approve", "risk_score": 20, "confidence_score": 0.9}
+
+    monkeypatch.setattr(BankStatementAgent, "analyze", quick_analysis)
+    monkeypatch.setattr(SalaryStatementAgent, "analyze", quick_analysis)
+    monkeypatch.setattr(VerificationAgent, "analyze", slow_analysis)
+    processor = LoanApplicationProcessor()
+    processor.comm_hub.facilitator_model = None
+
+    async with asyncio.TaskGroup() as group:
+        tasks = processor._start_parallel_analysis(sample_application, group)
+        deliberation_needed = group.create_task(processor._deliberation_needed(tasks))
+
+        opening = await asyncio.wait_for(
+            processor._opening_contribution(
+                sample_application.model_dump(),
+                "bank_analysis",
+                processor.bank_agent,
+                tasks["bank_analysis"],
+                deliberation_needed,
+            ),
+            timeout=1,
+        )
+
+        assert "recommendation" in opening
+        assert not tasks["verification_analysis"].done()
+        release.set()
+    results = [task.result() for task in tasks.values()]
+    assert [r["recommendation"] for r in results] == ["approve", "review", "approve"]
+
+
+async def test_final_decision_collects_flags_in_agent_order(sample_application):
+    """Test that red flags and scores are read from each analysis, with defaults."""
+    processor = LoanApplicationProcessor()
+    analysis_results = {
+        "verification_analysis": {"red_flags": ["address"], "risk_score": 30},
+        "bank_analysis": {"red_flags": ["overdraft"], "risk_score": 30},
+        "salary_analysis": None,
+    }
+
+    result = await processor._make_final_decision(
+        sample_application,
+        analysis_results,
+        {"overall_recommendation": "review", "confidence_score": 0.5, "risk_score": 30},
+    )
+
+    assert result.detailed_report["red_flags"] == ["overdraft", "address"]
+    assert "analysis_results" not in result.detailed_report
+    assert result.bank_analysis.red_flags == ["overdraft"]
+    assert result.confidence_score == 0.5
+    assert result.detailed_report["processing_timestamp"] == result.decision_timestamp.isoformat(
+        timespec="seconds"
+    )
+
+
+async def test_verification_scores_by_legitimacy(sample_application):
+    """Test the per-check confidence table and unverified red flags."""
+    agent = VerificationAgent()
+
+    analysis = await agent._compile_verification_results(
+        {"legitimacy": "assumed_legitimate"},
+        {"legitimacy": "unknown"},
+        {"valid": False},
+        {},
+        sample_application,
+    )
+
+    assert analysis["red_flags"] == [
+        "Company could not be verified",
+        "Address could not be verified",
+    ]
+    assert analysis["confidence_score"] == round((0.9 + 0.6 + 0.5) / 3 * 0.8, 2)
+
+
+async def test_timed_out_analysis_becomes_error_analysis(monkeypatch):
+    """Test that a sub-agent timeout yields an error analysis instead of raising."""
+    monkeypatch.setattr(LoanApplicationProcessor, "AGENT_TIMEOUT", 0.01)
+    processor = LoanApplicationProcessor()
+
+    result = await processor._run_analysis(
+        "bank_analysis", "BankStatementAgent", asyncio.sleep(1)
+    )
+
+    assert result["risk_score"] == 100
+    assert "timed out after 0.01s" in result["reasoning"]
+
+
+def test_deliberation_skipped_only_when_analyses_agree():
+    """Test the unanimity and risk-spread conditions for skipping deliberation."""
+    processor = LoanApplicationProcessor()
+
+    def results(*pairs):
+        return {
+            key: {"recommendation": rec, "risk_score": risk}
+            for key, (rec, risk) in zip(
+                ("bank_analysis", "salary_analysis", "verification_analysis"), pairs
+            )
+        }
+
+    assert processor._analyses_agree(results(("approve", 20), ("approve", 25), ("approve", 34)))
+    assert not processor._analyses_agree(results(("approve", 20), ("approve", 25), ("approve", 35)))
+    assert not processor._analyses_agree(results(("approve", 20), ("review", 25), ("approve", 30)))
+    assert not processor._analyses_agree(results(("approve", 20), ("approve", 25)))
+
+
+def test_verification_agents_share_tools():
+    """Test that verification tools are created once per process."""
+    first, second = VerificationAgent(), VerificationAgent()
+
+    assert first.web_tools is second.web_tools
+    assert first.data_fetcher is second.data_fetcher
+
+
+async def test_failed_analysis_with_braces_in_error_is_logged():
+    """Test that error messages containing braces do not break failure logging."""
+    processor = LoanApplicationProcessor()
+
+    async def failing():
+        raise ValueError("unexpected payload {'amount': None}")
+
+    result = await processor._run_analysis("salary_analysis", "SalaryStatementAgent", failing())
+
+    assert result["risk_score"] == 100
+    assert "{'amount': None}" in result["reasoning"]
+
+
+def test_system_status_timestamp_reused_within_second(monkeypatch):
+    """Test that status timestamps are formatted once per second."""
+    now = [1_700_000_000.2]
+    monkeypatch.setattr(main.time, "time", lambda: now[0])
+    processor = LoanApplicationProcessor()
+
+    first = processor.get_system_status()["timestamp"]
+    now[0] += 0.5
+    second = processor.get_system_status()["timestamp"]
+    now[0] += 1
+
+    assert second is first
+    assert first == datetime.fromtimestamp(1_700_000_000).isoformat()
+    assert processor.get_system_status()["timestamp"] != first
+
+
+def test_system_status_lists_agents():
+    """Test that status reports every agent, officer first."""
+    processor = LoanApplicationProcessor()
+
+    agents = processor.get_system_status()["agents"]
+
+    assert agents == (
+        "loan_officer_agent",
+        "bank_statement_agent",
+        "salary_statement_agent",
+        "verification_agent",
+    )
+    assert processor.get_system_status()["agents"] is agents
+
+
+async def test_parallel_analysis_maps_results_by_agent(monkeypatch, sample_application):
+    """Test that analysis tasks are keyed by agent and failures become error analyses."""
+
+    async def bank_analysis(self, application, **kwargs):
+        return {"recommendation": "approve", "risk_score": 10}
+
+    async def failing_analysis(self, application, **kwargs):
+        raise RuntimeError("service down")
+
+    async def verification_analysis(self, application, **kwargs):
+        return {"recommendation": "review", "risk_score": 40}
+
+    monkeypatch.setattr(BankStatementAgent, "analyze", bank_analysis)
+    monkeypatch.setattr(SalaryStatementAgent, "analyze", failing_analysis)
+    monkeypatch.setattr(VerificationAgent, "analyze", verification_analysis)
+    processor = LoanApplicationProcessor()
+
+    async with asyncio.TaskGroup() as group:
+        tasks = processor._start_parallel_analysis(sample_application, group)
+    results = {name: task.result() for name, task in tasks.items()}
+
+    assert results["bank_analysis"]["risk_score"] == 10
+    assert results["salary_analysis"]["risk_score"] == 100
+    assert "service down" in results["salary_analysis"]["reasoning"]
+    assert results["verification_analysis"]["risk_score"] == 40
+
+
+async def test_process_batch_bounds_concurrency(monkeypatch, sample_application):
+    """Test that batch processing caps in-flight applications and keeps input order."""
+    running = []
+    peak = []
+
+    async def fake_process(self, application):
+        running.append(application)
+        peak.append(len(running))
+        await asyncio.sleep(0)
+        running.pop()
+        if application.customer_id == "bad":
+            raise ValueError("unreadable")
+        return application.customer_id
+
+    monkeypatch.setattr(LoanApplicationProcessor, "process", fake_process)
+    applications = [
+        sample_application.model_copy(update={"customer_id": customer_id})
+        for customer_id in ("a", "bad", "c", "d")
+    ]
+
+    results = await LoanApplicationProcessor().process_batch(applications, max_concurrency=2)
+
+    assert max(peak) == 2
+    assert results[0] == "a"
+    assert isinstance(results[1], ValueError)
+    assert results[2:] == ["c", "d"]
+
+
+def test_processor_conditions_follow_risk_table():
+    """Test that each exceeded risk threshold adds its conditions, highest first."""
+    processor = LoanApplicationProcessor()
+
+    assert processor._generate_conditions(40, []) == []
+    assert processor._generate_conditions(61, ["a", "b", "c"]) == [
+        "Require income verification by third party",
+        "Require collateral evaluation",
+        "Require additional references",
+        "Subject to fraud investigation",
+        "Condition: a",
+        "Condition: b",
+    ]
+
+
+async def test_deliberation_context_is_json_serializable(monkeypatch, sample_application):
+    """Test that the shared application dump can be embedded in prompts as JSON."""
+    contexts = []
+
+    async def capture_discussion(self, participants, topic, context, **kwargs):
+        contexts.append(context)
+        return {"topic": topic, "rounds": []}
+
+    monkeypatch.setattr(AgentCommunicationHub, "facilitate_discussion", capture_discussion)
+
+    await LoanApplicationProcessor()._facilitate_deliberation(sample_application, {})
+
+    assert json.loads(json.dumps(contexts[0]))["application"]["customer_id"] == (
+        sample_application.customer_id
+    )
+
+
+async def test_process_failure_cancels_pending_work(monkeypatch, sample_application):
+    """Test that a failing phase raises its own error and cancels in-flight statements."""
+    cancelled = []
+
+    async def analysis(self, application, **kwargs):
+        recommendation = "approve" if isinstance(self, BankStatementAgent) else "review"
+        return {"recommendation": recommendation, "risk_score": 30}
+
+    async def hanging_contribution(self, agent_name, topic, context):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(agent_name)
+            raise
+
+    async def failing_deliberation(self, *args, **kwargs):
+        await asyncio.sleep(0)
+        raise ValueError("deliberation broke")
+
+    for agent_class in (BankStatementAgent, SalaryStatementAgent, VerificationAgent):
+        monkeypatch.setattr(agent_class, "analyze", analysis)
+    monkeypatch.setattr(AgentCommunicationHub, "contribute", hanging_contribution)
+    monkeypatch.setattr(
+        LoanApplicationProcessor, "_facilitate_deliberation", failing_deliberation
+    )
+
+    with pytest.raises(ValueError, match="deliberation broke"):
+        await LoanApplicationProcessor().process(sample_application)
+
+    assert len(cancelled) == 3
+
+
+async def test_no_opening_statement_requested_when_analyses_agree(
+    monkeypatch, sample_application
+):
+    """Test that skipping deliberation also skips the opening statement LLM calls."""
+    contributions = []
+
+    async def agreeing_analysis(self, application, **kwargs):
+        return {"recommendation": "approve", "risk_score": 20, "confidence_score": 0.9}
+
+    async def record_contribution(self, agent_name, topic, context):
+        contributions.append(agent_name)
+        return "statement"
+
+    for agent_class in (BankStatementAgent, SalaryStatementAgent, VerificationAgent):
+        monkeypatch.setattr(agent_class, "analyze", agreeing_analysis)
+    monkeypatch.setattr(AgentCommunicationHub, "contribute", record_contribution)
+    processor = LoanApplicationProcessor()
+    processor.comm_hub.facilitator_model = None
+
+    result = await processor.process(sample_application)
+
+    assert contributions == []
+    assert result.risk_score is not None
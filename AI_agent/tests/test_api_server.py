@@ -0,0 +1,228 @@
+"""Tests for the FastAPI server."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+import api_server
+from loanai_agent.models import DecisionResult
+
+
+async def test_db_pool_retried_after_failure(monkeypatch):
+    """Test that pool creation is retried when the database was unavailable."""
+    pools = iter([None, "pool"])
+    calls = []
+
+    async def fake_create_db_pool():
+        calls.append(1)
+        return next(pools)
+
+    monkeypatch.setattr(api_server, "_create_db_pool", fake_create_db_pool)
+    monkeypatch.setattr(api_server.app.state, "db_pool", None, raising=False)
+    monkeypatch.setattr(api_server.app.state, "db_pool_lock", asyncio.Lock(), raising=False)
+
+    assert await api_server._get_db_pool() is None
+    assert await api_server._get_db_pool() == "pool"
+    assert await api_server._get_db_pool() == "pool"
+    assert len(calls) == 2
+
+
+def _client_with_applications(monkeypatch, count):
+    """Create a test client whose status store holds ``count`` applications."""
+    store = api_server.TTLCache(maxsize=count + 1, ttl=60)
+    for i in range(count):
+        store[f"cust-{i}"] = {
+            "customerId": f"cust-{i}",
+            "status": "processing",
+            "progress": api_server.PROGRESS_RECEIVED,
+        }
+    monkeypatch.setattr(api_server, "application_status", store)
+    return TestClient(api_server.app)
+
+
+def test_list_applications_paginates(monkeypatch):
+    """Test that /api/applications returns one page and the total count."""
+    client = _client_with_applications(monkeypatch, 5)
+
+    body = client.get("/api/applications", params={"offset": 3, "limit": 10}).json()
+
+    assert body["count"] == 5
+    assert [a["customerId"] for a in body["applications"]] == ["cust-3", "cust-4"]
+    assert body["next_offset"] is None
+
+
+def test_list_applications_signals_truncation(monkeypatch):
+    """Test that a partial page reports the total and links to the next page."""
+    client = _client_with_applications(monkeypatch, 5)
+
+    response = client.get("/api/applications", params={"limit": 2})
+    body = response.json()
+
+    assert body["total"] == 5
+    assert body["next_offset"] == 2
+    assert response.headers["x-total-count"] == "5"
+    assert 'rel="next"' in response.headers["link"]
+    assert "offset=2" in response.headers["link"]
+
+
+def test_list_applications_offset_past_end(monkeypatch):
+    """Test that an offset beyond the store returns an empty page."""
+    client = _client_with_applications(monkeypatch, 2)
+
+    body = client.get("/api/applications", params={"offset": 50}).json()
+
+    assert body["count"] == 2
+    assert body["applications"] == []
+
+
+def test_list_applications_limit_capped(monkeypatch):
+    """Test that page sizes above the maximum are rejected."""
+    client = _client_with_applications(monkeypatch, 1)
+
+    response = client.get(
+        "/api/applications", params={"limit": api_server.MAX_APPLICATIONS_PAGE + 1}
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_status_unknown_customer_is_404(monkeypatch):
+    """Test that a missing or expired status entry returns 404."""
+    client = _client_with_applications(monkeypatch, 0)
+
+    assert client.get("/api/status/nobody").status_code == 404
+    assert client.get("/api/result/nobody").status_code == 404
+
+
+SAMPLE_REQUEST = {
+    "customerId": "cust-new",
+    "firstName": "Jane",
+    "lastName": "Smith",
+    "personalId": "987654321",
+    "gender": "female",
+    "birthYear": "1992",
+    "phone": "+1-555-987-6543",
+    "address": "456 Oak Avenue, New York, NY 10001",
+    "educationLevel": "master",
+    "university": "Harvard University",
+    "employmentStatus": "employed",
+    "companyName": "Acme Corp",
+    "monthlySalary": 8000.0,
+    "experienceYears": 6,
+    "loanPurpose": "personal",
+    "loanAmount": 20000.0,
+    "loanDuration": 36,
+}
+
+
+def test_process_rejects_when_queue_full(monkeypatch):
+    """Test that a full queue returns 503 and keeps the previous status entry."""
+    client = _client_with_applications(monkeypatch, 0)
+    previous = {"customerId": "cust-new", "status": "completed"}
+    api_server.application_status["cust-new"] = previous
+    queue = asyncio.Queue(maxsize=1)
+    queue.put_nowait(object())
+    monkeypatch.setattr(api_server, "processor", object())
+    monkeypatch.setattr(api_server.app.state, "work_queue", queue, raising=False)
+
+    response = client.post("/api/process", json=SAMPLE_REQUEST)
+
+    assert response.status_code == 503
+    assert api_server.application_status["cust-new"] is previous
+
+
+def test_worker_lifecycle_processes_queued_applications(monkeypatch):
+    """Test that lifespan workers pick up submitted applications."""
+    processed = []
+
+    class FakeProcessor:
+        async def process(self, application):
+            processed.append(application.customer_id)
+            return DecisionResult(
+                decision="APPROVED",
+                risk_score=20,
+                confidence_score=0.9,
+                reasoning="ok",
+            )
+
+    async def skip_database_update(customer_id, result):
+        return None
+
+    monkeypatch.setattr(api_server, "LoanApplicationProcessor", FakeProcessor)
+    monkeypatch.setattr(api_server, "_update_database_with_decision", skip_database_update)
+    monkeypatch.setattr(api_server, "LOAN_WORKERS", 1)
+    monkeypatch.setattr(
+        api_server, "application_status", api_server.TTLCache(maxsize=10, ttl=60)
+    )
+
+    with TestClient(api_server.app) as client:
+        assert client.post("/api/process", json=SAMPLE_REQUEST).status_code == 200
+    # Lifespan shutdown drains the queue before cancelling workers
+
+    assert processed == ["cust-new"]
+    assert api_server.application_status["cust-new"]["status"] == "completed"
+    progress = api_server._status_response(api_server.application_status["cust-new"])["progress"]
+    assert progress == {
+        "received": True,
+        "validating": True,
+        "processing": True,
+        "completed": True,
+    }
+
+
+def test_replayed_request_reuses_conversion(monkeypatch):
+    """Test that an identical payload reuses the converted application."""
+    monkeypatch.setattr(
+        api_server, "_conversion_cache", api_server.TTLCache(maxsize=2, ttl=60)
+    )
+    request = api_server.ProcessLoanRequest(**SAMPLE_REQUEST)
+
+    first = api_server._get_loan_application(request)
+    replay = api_server._get_loan_application(api_server.ProcessLoanRequest(**SAMPLE_REQUEST))
+    changed = api_server._get_loan_application(
+        api_server.ProcessLoanRequest(**{**SAMPLE_REQUEST, "loanAmount": 25000.0})
+    )
+
+    assert replay is first
+    assert changed is not first
+    assert changed.loan_request.loan_amount == 25000.0
+
+
+def test_list_applications_ndjson(monkeypatch):
+    """Test that format=ndjson streams one application per line."""
+    client = _client_with_applications(monkeypatch, 3)
+
+    response = client.get("/api/applications", params={"format": "ndjson", "limit": 2})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["customerId"] for line in lines] == ["cust-0", "cust-1"]
+
+
+def test_cors_preflight_is_cacheable():
+    """Test that preflight responses allow the frontend and set max-age."""
+    client = TestClient(api_server.app)
+
+    response = client.options(
+        "/api/status/cust-1",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "86400"
+    assert "DELETE" not in response.headers["access-control-allow-methods"]
+
+
+def test_process_invalid_body_is_422(monkeypatch):
+    """Test that raw-body validation errors keep FastAPI's 422 shape."""
+    client = _client_with_applications(monkeypatch, 0)
+
+    response = client.post("/api/process", json={**SAMPLE_REQUEST, "gender": "unknown"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "gender"]
+    assert "ProcessLoanRequest" in str(client.get("/openapi.json").json()["paths"]["/api/process"])
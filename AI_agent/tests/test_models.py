@@ -1,7 +1,11 @@
 """Tests for data models."""
 
 import pytest
+from pydantic import ValidationError
+
 from loanai_agent.models import (
+    BankStatementAnalysis,
+    DocumentType,
     EducationLevel,
     EmploymentStatus,
     Gender,
@@ -9,6 +13,7 @@ from loanai_agent.models import (
     LoanPurpose,
     PersonalInfo,
 )
+from loanai_agent.models.schemas import _latest_birth_year
 
 
 def test_personal_info_valid():
@@ -24,6 +29,7 @@ def test_personal_info_valid():
     )
     assert personal_info.first_name == "John"
     assert personal_info.gender == Gender.MALE
+    assert personal_info.full_name_lower == "john doe"
 
 
 def test_personal_info_invalid_birth_year():
@@ -71,3 +77,58 @@ def test_loan_application_serialization(sample_application):
     assert app_dict["customer_id"] == "test-cust-001"
     assert "personal_info" in app_dict
     assert "loan_request" in app_dict
+
+
+def test_loan_application_documents_by_type(sample_application):
+    """Test that documents are indexed by type, first document winning."""
+    index = sample_application.documents_by_type
+
+    assert index[DocumentType.BANK_STATEMENT] is sample_application.documents[0]
+    assert DocumentType.SALARY_STATEMENT in index
+    assert sample_application.documents_by_type is index
+
+
+def test_cached_application_views_cannot_go_stale(sample_application):
+    """Test that fields behind cached properties cannot be changed in place."""
+    assert sample_application.personal_info.full_name_lower
+
+    with pytest.raises(ValidationError):
+        sample_application.personal_info.first_name = "Jane"
+    with pytest.raises(ValidationError):
+        sample_application.documents = ()
+    assert isinstance(sample_application.documents, tuple)
+
+
+def test_analysis_results_are_frozen():
+    """Test that agent analysis results cannot be reassigned after construction."""
+    analysis = BankStatementAnalysis(risk_score=20, recommendation="approve")
+
+    with pytest.raises(ValidationError):
+        analysis.risk_score = 90
+    assert analysis.model_dump()["risk_score"] == 20
+
+
+@pytest.mark.parametrize(
+    ("birth_year", "message"),
+    [("19x0", "4-digit number"), ("1899", "Invalid birth year")],
+)
+def test_personal_info_birth_year_errors(birth_year, message):
+    """Test that malformed and out-of-range birth years report different errors."""
+    with pytest.raises(ValueError, match=message):
+        PersonalInfo(
+            first_name="John",
+            last_name="Doe",
+            personal_id="123456789",
+            gender=Gender.MALE,
+            birth_year=birth_year,
+            phone="+1-555-1234",
+            address="123 Main St",
+        )
+
+
+def test_latest_birth_year_follows_utc_day():
+    """Test that the birth year limit switches on the UTC new year."""
+    new_year_2025 = 20089  # days from the epoch to 2025-01-01 UTC
+
+    assert _latest_birth_year(new_year_2025 - 1) == 2024 - 18
+    assert _latest_birth_year(new_year_2025) == 2025 - 18
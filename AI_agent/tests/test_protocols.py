@@ -0,0 +1,165 @@
+"""Tests for decision protocols."""
+
+import asyncio
+
+from loanai_agent.agents import BankStatementAgent, SalaryStatementAgent
+from loanai_agent.protocols import (
+    AgentCommunicationHub,
+    AgentMessage,
+    DecisionThresholds,
+    RiskScoringEngine,
+    ThresholdCalibrator,
+)
+
+
+def test_calibrator_fits_thresholds_to_outcomes():
+    """Test that cut-offs move to where repaid and defaulted loans separate."""
+    risk_scores = [10, 20, 25, 30, 45, 50, 70, 80]
+    confidences = [0.9] * 8
+    outcomes = [True, True, True, True, True, False, False, False]
+
+    thresholds = ThresholdCalibrator(confidence_step=0.1).fit(
+        risk_scores, confidences, outcomes
+    )
+
+    assert thresholds.risk_thresholds[0] in range(46, 51)
+    assert thresholds.reject_from in range(46, 51)
+    assert thresholds.reject_from >= thresholds.approve_below
+
+
+def test_calibrator_keeps_defaults_without_signal():
+    """Test that defaults are kept when no candidate scores better."""
+    thresholds = ThresholdCalibrator().fit([50], [0.5], [False])
+
+    assert thresholds.approve_below == DecisionThresholds().approve_below
+    assert thresholds.confidence_cutoff == DecisionThresholds().confidence_cutoff
+
+
+def test_decision_thresholds_round_trip(tmp_path):
+    """Test that saved thresholds load back unchanged."""
+    path = tmp_path / "thresholds.json"
+    DecisionThresholds(35, 65, 0.55).save(path)
+
+    assert DecisionThresholds.load(path) == DecisionThresholds(35, 65, 0.55)
+
+
+async def test_discussion_ends_early_when_agents_agree():
+    """Test that agreeing analyses skip further deliberation rounds."""
+    agents = [BankStatementAgent(), SalaryStatementAgent()]
+    hub = AgentCommunicationHub(agents)
+    hub.facilitator_model = None
+    participants = [agent.name for agent in agents]
+
+    def discuss(recommendations):
+        analysis_results = {
+            name: {"recommendation": rec} for name, rec in zip(participants, recommendations)
+        }
+        return hub.facilitate_discussion(
+            participants=participants,
+            topic="risk",
+            context={"analysis_results": analysis_results},
+            max_rounds=2,
+            agreement_threshold=0.85,
+        )
+
+    agreed = await discuss(["approve", "approve"])
+    split = await discuss(["approve", "review"])
+
+    assert len(agreed["rounds"]) == 1
+    assert len(split["rounds"]) == 2
+    consensus = await hub.build_consensus(
+        {name: {"recommendation": "approve"} for name in participants}, agreed
+    )
+    assert consensus["agreement"] == 1.0
+    assert consensus["rounds_used"] == 1
+
+
+def test_risk_tables_match_tier_boundaries():
+    """Test that risk levels and loan amount tiers switch just past each bound."""
+    levels = [RiskScoringEngine._get_risk_level(s) for s in (20, 21, 40, 41, 60, 61, 75, 76, 100)]
+    adjustments = [
+        RiskScoringEngine._calculate_loan_risk({"loan_amount": a, "loan_purpose": "mortgage"})
+        for a in (100_000, 100_001, 250_001, 500_001)
+    ]
+
+    assert levels == [
+        "low", "moderate_low", "moderate_low", "moderate", "moderate",
+        "moderate_high", "moderate_high", "high", "high",
+    ]
+    assert adjustments == [5, 10, 15, 20]
+
+
+async def test_discussion_round_contributions_run_concurrently(monkeypatch):
+    """Test that every agent in a round is asked before any answer is awaited."""
+    agents = [BankStatementAgent(), SalaryStatementAgent()]
+    hub = AgentCommunicationHub(agents)
+    participants = [agent.name for agent in agents]
+    both_asked = asyncio.Event()
+    asked = []
+
+    async def fake_input(self, agent_name, topic, context, previous_rounds):
+        asked.append(agent_name)
+        if len(asked) == len(participants):
+            both_asked.set()
+        await asyncio.wait_for(both_asked.wait(), timeout=1)
+        return f"{agent_name} says review"
+
+    monkeypatch.setattr(AgentCommunicationHub, "_get_agent_input", fake_input)
+
+    log = await hub.facilitate_discussion(
+        participants=participants, topic="risk", context={}, max_rounds=1
+    )
+
+    messages = log["rounds"][0]["messages"]
+    assert [m["from_agent"] for m in messages] == participants
+    assert messages[1]["payload"]["response"] == f"{participants[1]} says review"
+
+
+def test_message_history_shares_message_dicts():
+    """Test that history reads reuse each message's dict instead of rebuilding it."""
+    hub = AgentCommunicationHub([])
+    message = AgentMessage("bank", "all", "discussion_contribution", {"response": "ok"}, "c-1")
+    hub._log_message(message)
+
+    history = hub.get_message_history()
+
+    assert history == [message.to_dict()]
+    assert history[0] is message.to_dict()
+    assert hub.get_message_history("c-1")[0] is history[0]
+    assert hub.get_message_history("other") == []
+
+
+def test_message_history_is_bounded():
+    """Test that old messages and their correlation index entries are dropped."""
+    hub = AgentCommunicationHub([], max_history=2)
+    for correlation_id in ("c-1", "c-2", "c-2"):
+        hub._log_message(AgentMessage("bank", "all", "note", {}, correlation_id))
+
+    assert [m["correlation_id"] for m in hub.get_message_history()] == ["c-2", "c-2"]
+    assert hub.get_message_history("c-1") == []
+    assert len(hub.get_message_history("c-2")) == 2
+    assert "c-1" not in hub._by_correlation
+
+
+async def test_agent_prompt_embeds_indented_json():
+    """Test that the agent's analysis and earlier rounds are rendered into the prompt."""
+    agent = BankStatementAgent()
+    hub = AgentCommunicationHub([agent])
+    prompts = []
+
+    class FakeModel:
+        async def generate_content_async(self, prompt):
+            prompts.append(prompt)
+            return type("Response", (), {"text": "approve"})()
+
+    hub.facilitator_model = FakeModel()
+    rounds = [{"round": n} for n in (1, 2, 3)]
+
+    response = await hub._get_agent_input(
+        agent.name, "risk", {"bank_analysis": {"risk_score": 30}}, rounds
+    )
+
+    assert response == "approve"
+    assert '{\n  "risk_score": 30\n}' in prompts[0]
+    assert '"round": 1' not in prompts[0]
+    assert '"round": 3' in prompts[0]
@@ -0,0 +1,190 @@
+"""Tests for analysis tools."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from loanai_agent.tools import (
+    DocumentProcessor,
+    FinancialAnalyzer,
+    WebVerificationTools,
+    analysis_tools,
+    verification_tools,
+)
+from loanai_agent.utils import TTLCache
+
+
+def test_summarize_transactions_single_pass_metrics():
+    """Test that the transaction summary feeds consistency and fraud checks."""
+    transactions = [
+        {"type": "credit", "amount": 5000, "description": "Salary ACME"},
+        {"type": "credit", "amount": 5000, "description": "SALARY acme"},
+        {"type": "credit", "amount": 300, "description": "Refund"},
+        {"type": "debit", "amount": 12000, "description": "Car"},
+        {"type": "debit", "amount": 200},
+    ]
+
+    summary = FinancialAnalyzer.summarize_transactions(transactions)
+
+    assert summary["total_credits"] == 10300
+    assert summary["total_debits"] == 12200
+    assert summary["salary_credits"] == 2
+    assert FinancialAnalyzer.income_consistency_from_summary(summary) == 0.7
+    assert FinancialAnalyzer.fraud_indicators_from_summary(summary) == [
+        "Large unusual transactions detected"
+    ]
+    assert FinancialAnalyzer.calculate_income_consistency([]) == 0.0
+
+
+def test_bank_statement_parse_cached_by_content(monkeypatch):
+    """Test that identical document content is only sent to the LLM once."""
+    calls = []
+
+    class FakeResponse:
+        text = '{"opening_balance": 100, "transactions": []}'
+
+    class FakeModel:
+        def generate_content(self, parts):
+            calls.append(parts)
+            return FakeResponse()
+
+    monkeypatch.setattr(analysis_tools, "_parse_cache", TTLCache(maxsize=4, ttl=60))
+    monkeypatch.setattr(analysis_tools.genai, "upload_file", lambda *args, **kwargs: None)
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    processor.model = FakeModel()
+
+    first = processor._analyze_bank_statement_with_llm(b"statement", "statement.pdf")
+    first["transactions"].append({"amount": 1})
+    second = processor._analyze_bank_statement_with_llm(b"statement", "statement.pdf")
+    processor._analyze_bank_statement_with_llm(b"other statement", "statement.pdf")
+
+    assert second == {"opening_balance": 100, "transactions": []}
+    assert len(calls) == 2
+
+
+def test_salary_statement_parse_cached_by_content(monkeypatch):
+    """Test that salary parses share the content cache without colliding with bank parses."""
+    calls = []
+
+    class FakeResponse:
+        text = '```json\n{"employee_name": "Jane Smith", "gross_salary": 8000}\n```'
+
+    class FakeModel:
+        def generate_content(self, parts):
+            calls.append(parts)
+            return FakeResponse()
+
+    monkeypatch.setattr(analysis_tools, "_parse_cache", TTLCache(maxsize=4, ttl=60))
+    monkeypatch.setattr(analysis_tools.genai, "upload_file", lambda *args, **kwargs: None)
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    processor.model = FakeModel()
+
+    first = processor._analyze_salary_statement_with_llm(b"payslip", "payslip.pdf")
+    first["gross_salary"] = 0
+    second = processor._analyze_salary_statement_with_llm(b"payslip", "payslip.pdf")
+    processor._analyze_bank_statement_with_llm(b"payslip", "payslip.pdf")
+
+    assert second == {"employee_name": "Jane Smith", "gross_salary": 8000}
+    assert len(calls) == 2
+
+
+def test_web_verification_coalesces_and_caches(monkeypatch):
+    """Test that concurrent identical lookups share one fetch and errors are not cached."""
+    monkeypatch.setitem(
+        verification_tools._verification_caches, "company", TTLCache(maxsize=4, ttl=60)
+    )
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_fetch(company_name):
+        calls.append(company_name)
+        if company_name == "Down Inc":
+            return {"verified": False, "error": "timeout"}
+        started.set()
+        release.wait(5)
+        return {"verified": True, "company_name": company_name}
+
+    monkeypatch.setattr(WebVerificationTools, "_fetch_company", staticmethod(fake_fetch))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(WebVerificationTools.verify_company, "Acme Corp")
+        started.wait(5)
+        second = pool.submit(WebVerificationTools.verify_company, "ACME CORP")
+        release.set()
+        assert first.result() == second.result()
+
+    assert WebVerificationTools.verify_company("acme corp")["verified"] is True
+    WebVerificationTools.verify_company("Down Inc")
+    WebVerificationTools.verify_company("Down Inc")
+    assert calls == ["Acme Corp", "Down Inc", "Down Inc"]
+
+
+def test_wikipedia_extracts_batched_across_lookups(monkeypatch):
+    """Test that concurrent extract requests share one multi-title query."""
+    requested = []
+
+    class FakeResponse:
+        def json(self):
+            return {
+                "query": {
+                    "normalized": [{"from": "acme corp", "to": "Acme Corp"}],
+                    "pages": {
+                        "1": {"title": "Acme Corp", "extract": "Acme makes anvils."},
+                        "-1": {"title": "Nowhere U", "missing": ""},
+                    },
+                }
+            }
+
+    def fake_get(api, url, params, **kwargs):
+        requested.append(params["titles"])
+        return FakeResponse()
+
+    monkeypatch.setattr(verification_tools, "_get", fake_get)
+    batcher = verification_tools._ExtractBatcher(window=0.2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        acme = pool.submit(batcher.fetch, "acme corp")
+        nowhere = pool.submit(batcher.fetch, "Nowhere U")
+        assert acme.result()["extract"] == "Acme makes anvils."
+        assert "missing" in nowhere.result()
+
+    assert len(requested) == 1
+    assert sorted(requested[0].split("|")) == ["Nowhere U", "acme corp"]
+
+
+async def test_address_lookups_queue_on_their_own_pool(monkeypatch):
+    """Test that lookups run on the API's pool and abandoned queued ones never start."""
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-nominatim")
+    monkeypatch.setitem(verification_tools._lookup_executors, "nominatim", pool)
+    monkeypatch.setitem(
+        verification_tools._verification_caches, "address", TTLCache(maxsize=4, ttl=60)
+    )
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_fetch(address):
+        calls.append((address, threading.current_thread().name))
+        started.set()
+        release.wait(5)
+        return {"valid": True}
+
+    monkeypatch.setattr(WebVerificationTools, "_fetch_address", staticmethod(fake_fetch))
+
+    first = asyncio.create_task(WebVerificationTools.verify_address_async("1 Main St"))
+    await asyncio.to_thread(started.wait, 5)
+    abandoned = asyncio.create_task(WebVerificationTools.verify_address_async("2 Oak Ave"))
+    await asyncio.sleep(0)
+    abandoned.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await abandoned
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first)["valid"] is True
+    pool.shutdown(wait=True)
+    assert [address for address, _ in calls] == ["1 Main St"]
+    assert calls[0][1].startswith("test-nominatim")
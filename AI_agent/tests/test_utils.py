@@ -0,0 +1,111 @@
+"""Tests for utility helpers."""
+
+from itertools import islice
+
+from loanai_agent.utils import Throttle, TTLCache
+
+
+class FakeClock:
+    """Controllable clock for expiry tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the oldest untouched entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # touch "a" so "b" becomes LRU
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries disappear after their TTL."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, timer=clock)
+    cache["a"] = 1
+    clock.now = 4
+    cache["b"] = 2
+
+    clock.now = 6
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert list(cache.values()) == [2]
+    assert len(cache) == 1
+
+
+def test_ttl_cache_full_prefers_expired_entries():
+    """Test that expired entries are dropped before evicting live ones."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=3, ttl=5, timer=clock)
+    cache["a"] = 1
+    cache["b"] = 2
+    clock.now = 3
+    cache["c"] = 3
+    assert cache["a"] == 1  # most recently used, but still written first
+
+    clock.now = 6
+    cache["d"] = 4
+
+    assert list(cache) == ["c", "d"]
+    assert cache.expire() == 0
+
+
+def test_ttl_cache_get_refreshes_recency_but_contains_does_not():
+    """Test which reads affect LRU order."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert "a" in cache
+    cache["c"] = 3
+    assert "a" not in cache
+
+    assert cache.get("b") == 2
+    cache["d"] = 4
+    assert "b" in cache
+    assert "c" not in cache
+
+
+def test_ttl_cache_values_is_lazy_view():
+    """Test that values() is a view usable for bounded pagination."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    for i in range(5):
+        cache[i] = i * 10
+
+    values = cache.values()
+    assert not isinstance(values, list)
+    assert list(islice(values, 1, 3)) == [10, 20]
+    assert list(cache) == [0, 1, 2, 3, 4]
+    assert dict(cache.items())[4] == 40
+
+
+def test_throttle_waits_for_window():
+    """Test that calls beyond the window limit sleep until the oldest expires."""
+    clock = FakeClock()
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    throttle = Throttle(max_concurrent=2, max_calls=2, period=10, timer=clock, sleep=fake_sleep)
+    with throttle:
+        pass
+    clock.now = 4
+    with throttle:
+        pass
+    with throttle:
+        pass
+
+    assert sleeps == [6]
+    assert clock.now == 10